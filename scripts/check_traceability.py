@@ -1,41 +1,175 @@
 #!/usr/bin/env python3
 """Validate requirements traceability (SWUT_XXX → SWR_XXX)."""
 
+import mmap
+import os
+import pickle
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 64 * 1024
 
-def extract_swut_from_tests(tests_dir: Path) -> Set[str]:
-    """Extract all SWUT_ references from test files."""
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_TESTS_DIR = _PROJECT_ROOT / "tests"
+_REQS_DIR = _PROJECT_ROOT / "docs" / "requirements"
+_TRACEABILITY_FILE = _PROJECT_ROOT / "docs" / "TRACEABILITY.md"
+_CACHE_FILE = _PROJECT_ROOT / ".cache" / "traceability.pkl"
+
+# A single alternation matches both ID kinds in one pass over each file:
+#   group 1 - test definitions like: def test_SWUT_MODEL_00001_function_type_enum_values():
+#             (captures just the SWUT_XXX_YYYYY prefix of the test name)
+#   group 2 - requirement definitions like: ### SWR_MODEL_00001
+_ID_RE = re.compile(rb'def\s+test_(SWUT_[A-Z_]+_\d+)_[^(]|#+\s*(SWR_[A-Z_]+_\d+)')
+# Traceability table cells start with the ID they reference, optionally
+# followed by notes or further comma-separated IDs. Placeholders such as
+# SWR_[MODULE]_00001 do not match.
+_SWR_CELL_RE = re.compile(r'SWR_[A-Z_]+_\d+')
+_SWUT_CELL_RE = re.compile(r'SWUT_[A-Z_]+_\d+')
+# Fixed literals contained in every _ID_RE match. Files holding none of them
+# are rejected with a C-level substring search before the regex runs.
+_ID_LITERALS = (b'test_SWUT_', b'SWR_')
+
+
+def _iter_files(
+    root: Path, prefix: str, suffix: str, recursive: bool = True
+) -> Iterator[str]:
+    """Yield paths of files under root whose names match prefix and suffix."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk never descends into caches or hidden dirs
+        if recursive:
+            dirnames[:] = [
+                d for d in dirnames if d != '__pycache__' and not d.startswith('.')
+            ]
+        else:
+            dirnames.clear()
+        for name in filenames:
+            if name.startswith(prefix) and name.endswith(suffix):
+                yield os.path.join(dirpath, name)
+
+
+def _chunksize(num_items: int) -> int:
+    """Pick an executor.map chunk size giving each worker ~4 chunks."""
+    workers = os.cpu_count() or 1
+    return max(1, num_items // (4 * workers))
+
+
+def _find_ids(data) -> List[Tuple[bytes, bytes]]:
+    """Run _ID_RE over bytes or an mmap, skipping data without ID literals."""
+    if any(data.find(literal) != -1 for literal in _ID_LITERALS):
+        return _ID_RE.findall(data)
+    return []
+
+
+def _scan_file(job: Tuple[str, bool]) -> Tuple[Set[str], Set[str]]:
+    """Extract SWUT_ references or SWR_ definitions from a single file.
+
+    job is (path, is_test_file). Test files only contribute SWUT_ references
+    and requirement documents only SWR_ definitions, so e.g. an SWR comment
+    in a test file does not count as a defined requirement.
+    """
+    path, is_test_file = job
     swut_refs = set()
+    swr_defs = set()
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                matches = _find_ids(data)
+        else:
+            matches = _find_ids(f.read())
+
+    for swut, swr in matches:
+        if is_test_file:
+            if swut:
+                swut_refs.add(swut.decode('ascii'))
+        elif swr:
+            swr_defs.add(swr.decode('ascii'))
+
+    return swut_refs, swr_defs
+
 
-    for test_file in tests_dir.rglob("test_*.py"):
-        content = test_file.read_text()
-        # Match function definitions like: def test_SWUT_MODEL_00001_function_type_enum_values():
-        matches = re.findall(r'def\s+(test_SWUT_[A-Z_]+_\d+_[^(]+)', content)
-        # Extract just the SWUT_XXX_YYYYY prefix from the test name
-        for m in matches:
-            # Extract SWUT_XXX_YYYYY from test_SWUT_XXX_YYYYY_description
-            swut_match = re.match(r'(test_)?(SWUT_[A-Z_]+_\d+)', m)
-            if swut_match:
-                swut_refs.add(swut_match.group(2))
+def _scan(
+    test_paths: List[str], requirement_paths: List[str]
+) -> Tuple[Set[str], Set[str]]:
+    """Extract SWUT_ references from test files and SWR_ definitions from
+    requirement documents."""
+    swut_refs: Set[str] = set()
+    swr_defs: Set[str] = set()
+    # Tag each path with its kind, so both kinds share one pool
+    jobs = [(path, True) for path in test_paths]
+    jobs += [(path, False) for path in requirement_paths]
 
-    return swut_refs
+    # Files are independent, so scan them in parallel and merge the results
+    with ProcessPoolExecutor() as executor:
+        for refs, defs in executor.map(
+            _scan_file, jobs, chunksize=_chunksize(len(jobs))
+        ):
+            swut_refs |= refs
+            swr_defs |= defs
+
+    return swut_refs, swr_defs
+
+
+def _test_files(tests_dir: Path) -> List[str]:
+    """List the test modules under tests_dir."""
+    return list(_iter_files(tests_dir, 'test_', '.py'))
+
+
+def _requirement_files(reqs_dir: Path) -> List[str]:
+    """List the requirement documents in reqs_dir."""
+    return list(_iter_files(reqs_dir, '', '.md', recursive=False))
+
+
+def extract_swut_from_tests(tests_dir: Path) -> Set[str]:
+    """Extract all SWUT_ references from test files."""
+    return _scan(_test_files(tests_dir), [])[0]
 
 
 def extract_swr_from_requirements(reqs_dir: Path) -> Set[str]:
     """Extract all SWR_ definitions from requirement documents."""
-    swr_defs = set()
+    return _scan([], _requirement_files(reqs_dir))[1]
+
+
+def _snapshot(paths: List[str]) -> Dict[str, Tuple[int, int]]:
+    """Collect (mtime_ns, size) for each existing file."""
+    snapshot = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
 
-    for req_file in reqs_dir.glob("*.md"):
-        content = req_file.read_text()
-        # Match definitions like: ### SWR_MODEL_00001
-        matches = re.findall(r'#+\s*SWR_[A-Z_]+_\d+', content)
-        swr_defs.update(m.strip().replace('#', '').strip() for m in matches)
+def _load_cache(
+    cache_file: Path, snapshot: Dict[str, Tuple[int, int]]
+) -> Optional[tuple]:
+    """Return cached scan results if the scanned files are unchanged."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_snapshot, results = pickle.load(f)
+    except Exception:
+        return None
+    return results if cached_snapshot == snapshot else None
 
-    return swr_defs
+
+def _save_cache(
+    cache_file: Path, snapshot: Dict[str, Tuple[int, int]], results: tuple
+) -> None:
+    """Atomically write scan results together with the file snapshot."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump((snapshot, results), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
 
 
 def parse_traceability(traceability_file: Path) -> Dict[str, str]:
@@ -46,10 +180,20 @@ def parse_traceability(traceability_file: Path) -> Dict[str, str]:
         return trace_map
 
     content = traceability_file.read_text()
-    # Parse markdown table rows with SWR and SWUT
-    rows = re.findall(r'\|\s*(SWR_[A-Z_]+_\d+)\s*\|\s*(SWUT_[A-Z_]+_\d+)', content)
-    for swr, swut in rows:
-        trace_map[swut] = swr
+    # Parse markdown table rows with an SWR cell directly followed by an SWUT
+    # cell; every SWUT listed in the cell is linked to the SWR
+    for line in content.splitlines():
+        if 'SWR_' not in line or 'SWUT_' not in line:
+            continue
+        cells = [cell.strip() for cell in line.split('|')]
+        for swr_cell, swut_cell in zip(cells, cells[1:]):
+            swr = _SWR_CELL_RE.match(swr_cell)
+            if not swr:
+                continue
+            for swut_part in swut_cell.split(','):
+                swut = _SWUT_CELL_RE.match(swut_part.strip())
+                if swut:
+                    trace_map[swut.group()] = swr.group()
 
     return trace_map
 
@@ -60,69 +204,74 @@ def validate_traceability(
     trace_map: Dict[str, str]
 ) -> Tuple[int, int, Set[str], Set[str]]:
     """Validate traceability and return statistics."""
-    orphaned_tests = set()
-    untested_requirements = set()
-
-    # Check for orphaned tests (SWUT without mapped SWR)
-    for swut in swut_refs:
-        if swut not in trace_map:
-            orphaned_tests.add(swut)
-        elif trace_map[swut] not in swr_defs:
-            orphaned_tests.add(swut)
+    # Check for orphaned tests (SWUT without mapped SWR, or mapped to an unknown SWR)
+    mapped_swuts = trace_map.keys()
+    unmapped_tests = swut_refs - mapped_swuts
+    dangling_tests = {
+        swut for swut in swut_refs & mapped_swuts if trace_map[swut] not in swr_defs
+    }
+    orphaned_tests = unmapped_tests | dangling_tests
 
     # Check for untested requirements (SWR without mapped SWUT)
-    mapped_swrs = set(trace_map.values())
-    for swr in swr_defs:
-        if swr not in mapped_swrs:
-            untested_requirements.add(swr)
+    untested_requirements = swr_defs - set(trace_map.values())
 
     return len(swut_refs), len(swr_defs), orphaned_tests, untested_requirements
 
 
 def main() -> int:
     """Run traceability validation."""
-    project_root = Path(__file__).parent.parent
-    tests_dir = project_root / "tests"
-    reqs_dir = project_root / "docs" / "requirements"
-    traceability_file = project_root / "docs" / "TRACEABILITY.md"
+    print("=== Checking Requirements Traceability ===\n", flush=True)
 
-    print("=== Checking Requirements Traceability ===\n")
+    # Skip the scan entirely when no scanned file changed since the last run
+    test_files = _test_files(_TESTS_DIR)
+    requirement_files = _requirement_files(_REQS_DIR)
+    snapshot = _snapshot(
+        test_files + requirement_files + [os.fspath(_TRACEABILITY_FILE)]
+    )
+    cached = _load_cache(_CACHE_FILE, snapshot)
 
-    # Extract references
-    swut_refs = extract_swut_from_tests(tests_dir)
-    swr_defs = extract_swr_from_requirements(reqs_dir)
-    trace_map = parse_traceability(traceability_file)
+    if cached is not None:
+        swut_refs, swr_defs, trace_map = cached
+    else:
+        # Extract references from tests and requirements in a single pass
+        swut_refs, swr_defs = _scan(test_files, requirement_files)
+        trace_map = parse_traceability(_TRACEABILITY_FILE)
+        _save_cache(_CACHE_FILE, snapshot, (swut_refs, swr_defs, trace_map))
 
     # Validate
     test_count, req_count, orphaned_tests, untested_reqs = validate_traceability(
         swut_refs, swr_defs, trace_map
     )
 
-    print(f"Test cases found: {test_count}")
-    print(f"Requirements found: {req_count}")
-    print(f"Traceability links: {len(trace_map)}")
+    # Collect the report and emit it with a single write
+    out = [
+        f"Test cases found: {test_count}",
+        f"Requirements found: {req_count}",
+        f"Traceability links: {len(trace_map)}",
+    ]
 
     # Report issues (warnings only, don't fail CI)
     if orphaned_tests:
-        print(f"\n⚠️  Orphaned tests ({len(orphaned_tests)}):")
-        print("    (Tests without SWR links - see docs/tests/ for traceability)")
+        out.append(f"\n⚠️  Orphaned tests ({len(orphaned_tests)}):")
+        out.append("    (Tests without SWR links - see docs/tests/ for traceability)")
         for swut in sorted(orphaned_tests)[:5]:  # Show first 5
-            print(f"  - {swut}")
+            out.append(f"  - {swut}")
         if len(orphaned_tests) > 5:
-            print(f"  ... and {len(orphaned_tests) - 5} more")
+            out.append(f"  ... and {len(orphaned_tests) - 5} more")
     else:
-        print("\n✅ All tests trace to requirements")
+        out.append("\n✅ All tests trace to requirements")
 
     if untested_reqs:
-        print(f"\n⚠️  Untested requirements ({len(untested_reqs)}):")
+        out.append(f"\n⚠️  Untested requirements ({len(untested_reqs)}):")
         for swr in sorted(untested_reqs)[:10]:  # Show first 10
-            print(f"  - {swr}")
+            out.append(f"  - {swr}")
         if len(untested_reqs) > 10:
-            print(f"  ... and {len(untested_reqs) - 10} more")
+            out.append(f"  ... and {len(untested_reqs) - 10} more")
     else:
-        print("✅ All requirements have tests")
+        out.append("✅ All requirements have tests")
 
-    print("\nℹ️  Full traceability documentation: docs/tests/ and docs/TRACEABILITY.md")
+    out.append("\nℹ️  Full traceability documentation: docs/tests/ and docs/TRACEABILITY.md")
+    sys.stdout.write("\n".join(out) + "\n")
     return 0  # Always succeed - warnings only
 
 
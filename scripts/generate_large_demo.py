@@ -5,7 +5,7 @@ Generate 1000 demo AUTOSAR C files for testing function database performance.
 
 import random
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # AUTOSAR patterns
 FUNCTION_TYPES = [
@@ -54,12 +54,14 @@ PARAMETER_TYPES = [
 random.seed(42)
 
 
-def generate_function_name() -> str:
-    """Generate a realistic AUTOSAR function name."""
-    prefix = random.choice(MODULE_PREFIXES)
-    verb = random.choice(FUNCTION_VERBS)
-    noun = random.choice(FUNCTION_NOUNS)
-    return f"{prefix}_{verb}{noun}"
+def generate_function_names(count: int) -> List[str]:
+    """Generate realistic AUTOSAR function names."""
+    prefixes = random.choices(MODULE_PREFIXES, k=count)
+    verbs = random.choices(FUNCTION_VERBS, k=count)
+    nouns = random.choices(FUNCTION_NOUNS, k=count)
+    return [
+        f"{prefix}_{verb}{noun}" for prefix, verb, noun in zip(prefixes, verbs, nouns)
+    ]
 
 
 def generate_parameters(num_params: int = None) -> List[str]:
@@ -68,16 +70,15 @@ def generate_parameters(num_params: int = None) -> List[str]:
         num_params = random.randint(0, 4)
 
     params = []
-    for i in range(num_params):
-        param_type = random.choice(PARAMETER_TYPES)
-
+    param_types = random.choices(PARAMETER_TYPES, k=num_params)
+    qualifier_rolls = [random.random() for _ in range(num_params)]
+    for i, (param_type, roll) in enumerate(zip(param_types, qualifier_rolls)):
         # Choose parameter qualifier
-        qualifier_roll = random.random()
-        if qualifier_roll < 0.6:
+        if roll < 0.6:
             qualifier = f"VAR({param_type}, AUTOMATIC)"
-        elif qualifier_roll < 0.8:
+        elif roll < 0.8:
             qualifier = f"P2VAR({param_type}, AUTOMATIC, APPL_DATA)"
-        elif qualifier_roll < 0.9:
+        elif roll < 0.9:
             qualifier = f"P2CONST({param_type}, AUTOMATIC, APPL_DATA)"
         else:
             qualifier = f"CONST({param_type}, AUTOMATIC)"
@@ -113,26 +114,35 @@ def generate_function_declaration(func_name: str, is_static: bool = False) -> tu
     return declaration, return_type, params_str
 
 
-def generate_file_content(file_index: int, num_functions: int = 5) -> str:
-    """Generate content for a single C file."""
+def generate_file_content(
+    file_index: int, num_functions: int = 5, func_names: Optional[List[str]] = None
+) -> str:
+    """Generate content for a single C file.
+
+    Function names are drawn here unless pre-drawn names are passed in.
+    """
     module_name = f"Module{file_index:04d}"
     functions = []
 
+    if func_names is None:
+        func_names = generate_function_names(num_functions)
+
     # Generate function declarations
-    for i in range(num_functions):
-        func_name = generate_function_name()
+    for i, func_name in enumerate(func_names):
         is_static = i > 0  # First function is public, rest are static
         decl, return_type, params_str = generate_function_declaration(func_name, is_static)
         functions.append((decl, return_type, params_str, func_name))
 
     # Build file content
-    content = f"/*\n * {module_name} - AUTOSAR Demo File {file_index}\n */\n\n"
-    content += f'#include "{module_name}.h"\n\n'
+    parts = [
+        f"/*\n * {module_name} - AUTOSAR Demo File {file_index}\n */\n\n",
+        f'#include "{module_name}.h"\n\n',
+    ]
 
     # Add function definitions
     for i, (decl, return_type, params_str, func_name) in enumerate(functions):
-        content += f"/* Function definition */\n"
-        content += decl.replace(";", "\n") + " {\n"
+        parts.append("/* Function definition */\n")
+        parts.append(decl.replace(";", "\n") + " {\n")
 
         # Add function calls to other functions (create call chains)
         if i < len(functions) - 1:
@@ -141,36 +151,36 @@ def generate_file_content(file_index: int, num_functions: int = 5) -> str:
             num_args = len(params_str.split(",")) if params_str != "void" else 0
 
             if num_args == 0:
-                content += f"    {next_func}();\n"
+                parts.append(f"    {next_func}();\n")
             else:
                 args = ", ".join([f"0x{i*16:02X}" for i in range(num_args)])
-                content += f"    {next_func}({args});\n"
+                parts.append(f"    {next_func}({args});\n")
 
         # Add some inline logic comments
-        content += "    /* Local processing */\n"
+        parts.append("    /* Local processing */\n")
 
         if return_type != "void":
-            content += f"    return ({return_type})0;\n"
+            parts.append(f"    return ({return_type})0;\n")
 
-        content += "}\n\n"
+        parts.append("}\n\n")
 
-    return content
+    return "".join(parts)
 
 
 def generate_header_content(file_index: int, functions: List[str]) -> str:
     """Generate content for a header file."""
     module_name = f"Module{file_index:04d}"
-    content = f"/*\n * {module_name} - Header File\n */\n\n"
-    content += f"#ifndef {module_name.upper()}_H\n"
-    content += f"#define {module_name.upper()}_H\n\n"
-    content += "#include \"Std_Types.h\"\n\n"
-
-    # Add public function declarations (only first function from each file)
-    content += "/* Public API */\n"
-    content += functions[0] + "\n\n"
-
-    content += f"#endif /* {module_name.upper()}_H */\n"
-    return content
+    parts = [
+        f"/*\n * {module_name} - Header File\n */\n\n",
+        f"#ifndef {module_name.upper()}_H\n",
+        f"#define {module_name.upper()}_H\n\n",
+        "#include \"Std_Types.h\"\n\n",
+        # Add public function declarations (only first function from each file)
+        "/* Public API */\n",
+        functions[0] + "\n\n",
+        f"#endif /* {module_name.upper()}_H */\n",
+    ]
+    return "".join(parts)
 
 
 def main():
@@ -182,13 +192,19 @@ def main():
 
     print(f"Generating {num_files} AUTOSAR C files in {output_dir}/...")
 
-    for i in range(num_files):
+    # Draw function counts and names for the whole run up front
+    function_counts = random.choices(range(3, 9), k=num_files)
+    all_func_names = generate_function_names(sum(function_counts))
+    offset = 0
+
+    for i, num_functions in enumerate(function_counts):
         # Generate C file
-        c_content = generate_file_content(i, num_functions=random.randint(3, 8))
+        func_names = all_func_names[offset:offset + num_functions]
+        offset += num_functions
+        c_content = generate_file_content(i, func_names=func_names)
         c_filename = output_dir / f"module_{i:04d}.c"
 
-        with open(c_filename, "w") as f:
-            f.write(c_content)
+        c_filename.write_bytes(c_content.encode("utf-8"))
 
         # Generate corresponding header file (only for some files)
         if i % 2 == 0:  # Every other file gets a header
@@ -203,8 +219,7 @@ def main():
             if func_decls:
                 h_content = generate_header_content(i, func_decls)
                 h_filename = output_dir / f"module_{i:04d}.h"
-                with open(h_filename, "w") as f:
-                    f.write(h_content)
+                h_filename.write_bytes(h_content.encode("utf-8"))
 
         if (i + 1) % 100 == 0:
             print(f"  Generated {i + 1}/{num_files} files...")
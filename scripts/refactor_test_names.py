@@ -7,9 +7,24 @@ Transforms test_SWUT_XXXXX_YYYYY_descriptive_name() to test_descriptive_name()
 with SWUT_XXXXX_YYYYY added as a docstring.
 """
 
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+_TEST_PREFIX = 'test_'
+# SWUT_XXXXX_YYYYY, matched right after the test_ prefix of a function name
+_SWUT_ID_RE = re.compile(r'SWUT_[A-Z_]+_\d+')
+# Matches: [indent]def test_SWUT_XXXXX_YYYYY_descriptive_name(...)[ -> return_type]:
+# Groups: (1=indent, 2='def ', 3=func_name, 4=params, 5=return annotation)
+_DEF_RE = re.compile(
+    r'(\s*)(def\s+)(test_SWUT_[A-Z_]+_\d+_[^(]+)(\([^)]*\))(\s*(->\s+[^:]+))?:'
+)
+# Single-line docstring: [indent]"""..."""
+# Groups: (1=indent, 2=docstring text)
+_DOCSTRING_RE = re.compile(r'(\s+)"""(.+?)"""')
+
 
 def extract_swut_id(function_name: str) -> tuple:
     """Extract SWUT ID and descriptive name from test function name.
@@ -17,13 +32,15 @@ def extract_swut_id(function_name: str) -> tuple:
     Returns:
         tuple: (swut_id, new_function_name, original_function_name)
     """
-    # Match pattern: test_SWUT_XXXXX_YYYYY_descriptive_name
-    match = re.match(r'(test_)(SWUT_[A-Z_]+_\d+)(_(.+))$', function_name)
-    if match:
-        swut_id = match.group(2)  # SWUT_XXXXX_YYYYY without test_ prefix
-        descriptive_part = match.group(4)
-        new_function_name = f"test_{descriptive_part}"
-        return swut_id, new_function_name, function_name
+    if function_name.startswith(_TEST_PREFIX):
+        match = _SWUT_ID_RE.match(function_name, len(_TEST_PREFIX))
+        # The ID must be followed by '_' and a non-empty descriptive part
+        if match and function_name.startswith('_', match.end()):
+            descriptive_part = function_name[match.end() + 1:]
+            if descriptive_part:
+                swut_id = match.group()  # SWUT_XXXXX_YYYYY without test_ prefix
+                new_function_name = f"{_TEST_PREFIX}{descriptive_part}"
+                return swut_id, new_function_name, function_name
     return None, function_name, function_name
 
 
@@ -34,8 +51,13 @@ def refactor_test_file(file_path: Path) -> int:
         int: Number of functions refactored
     """
     content = file_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
-    new_lines = []
+
+    # Most files need no edits (e.g. after a first refactoring run)
+    if not _DEF_RE.search(content):
+        return 0
+
+    lines = content.splitlines(keepends=True)
+    out = io.StringIO()
     refactor_count = 0
     i = 0
 
@@ -43,9 +65,7 @@ def refactor_test_file(file_path: Path) -> int:
         line = lines[i]
 
         # Check if this line defines a test function with SWUT ID
-        # Matches: [indent]def test_SWUT_XXXXX_YYYYY_descriptive_name(...)[ -> return_type]:
-        # Groups: (1=indent, 2='def ', 3=func_name, 4=params, 5=return annotation)
-        match = re.search(r'(\s*)(def\s+)(test_SWUT_[A-Z_]+_\d+_[^(]+)(\([^)]*\))(\s*(->\s+[^:]+))?:', line)
+        match = _DEF_RE.search(line)
         if match:
             indent = match.group(1)
             def_kw = match.group(2)
@@ -57,46 +77,42 @@ def refactor_test_file(file_path: Path) -> int:
 
             if swut_id:
                 # Replace function definition
-                new_def = f"{indent}{def_kw}{new_name}{params}{return_annotation}:"
-                new_lines.append(new_def)
+                out.write(f"{indent}{def_kw}{new_name}{params}{return_annotation}:\n")
                 refactor_count += 1
 
                 # Check next line for docstring
                 if i + 1 < len(lines):
                     next_line = lines[i + 1]
-                    docstring_match = re.match(r'\s+"""(.+?)"""', next_line)
+                    docstring_match = _DOCSTRING_RE.match(next_line)
 
                     if docstring_match:
                         # Existing docstring - prepend SWUT ID
-                        existing_doc = docstring_match.group(1)
-                        doc_indent = len(next_line) - len(next_line.lstrip())
-                        indent_str = ' ' * doc_indent
+                        indent_str = docstring_match.group(1)
+                        existing_doc = docstring_match.group(2)
 
-                        new_lines.append(f'{indent_str}"""{swut_id}')
-                        new_lines.append(f'{indent_str}')
-                        new_lines.append(f'{indent_str}{existing_doc}"""')
+                        out.write(f'{indent_str}"""{swut_id}\n')
+                        out.write(f'{indent_str}\n')
+                        out.write(f'{indent_str}{existing_doc}"""\n')
                         i += 1  # Skip the original docstring line
                     else:
                         # No docstring - add one
-                        doc_indent = len(line) - len(line.lstrip()) + 4
-                        indent_str = ' ' * doc_indent
-                        new_lines.append(f'{indent_str}"""{swut_id}"""')
+                        indent_str = ' ' * (len(indent) + 4)
+                        out.write(f'{indent_str}"""{swut_id}"""\n')
                 else:
                     # End of file, add docstring
-                    doc_indent = len(line) - len(line.lstrip()) + 4
-                    indent_str = ' ' * doc_indent
-                    new_lines.append(f'{indent_str}"""{swut_id}"""')
+                    indent_str = ' ' * (len(indent) + 4)
+                    out.write(f'{indent_str}"""{swut_id}"""\n')
             else:
                 # No SWUT ID found, keep original
-                new_lines.append(line)
+                out.write(line)
         else:
-            new_lines.append(line)
+            out.write(line)
 
         i += 1
 
     # Write back if changes were made
     if refactor_count > 0:
-        file_path.write_text('\n'.join(new_lines) + '\n', encoding='utf-8')
+        file_path.write_text(out.getvalue(), encoding='utf-8')
 
     return refactor_count
 
@@ -118,8 +134,13 @@ def main():
     total_refactored = 0
     files_modified = []
 
-    for test_file in test_files:
-        count = refactor_test_file(test_file)
+    # Each file is refactored independently, so spread them across processes
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(test_files) // (4 * workers))
+    with ProcessPoolExecutor() as executor:
+        counts = list(executor.map(refactor_test_file, test_files, chunksize=chunksize))
+
+    for test_file, count in zip(test_files, counts):
         if count > 0:
             files_modified.append((test_file, count))
             total_refactored += count
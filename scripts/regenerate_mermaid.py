@@ -4,7 +4,8 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from autosar_calltree.database.function_database import FunctionDatabase
 from autosar_calltree.analyzers.call_tree_builder import CallTreeBuilder
@@ -20,7 +21,7 @@ def main():
     print("Building function database...")
     config = ModuleConfig(CONFIG_FILE)
     db = FunctionDatabase(source_dir=SOURCE_DIR, module_config=config)
-    db.build_database(use_cache=False, verbose=False)
+    db.build_database(use_cache=True, verbose=False)
 
     print("Building call tree...")
     builder = CallTreeBuilder(db)
@@ -16,10 +16,117 @@ Requirements:
     - Generated XMI file from AUTOSAR Call Tree Analyzer
 """
 
+import os
 import sys
 from pathlib import Path
-from xml.etree import ElementTree
-from typing import Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from lxml import etree
+
+UML_NAMESPACE = "http://www.eclipse.org/uml2/5.0.0/UML"
+XMI_NAMESPACE = "http://www.omg.org/spec/XMI/20131001"
+
+# Namespace-qualified names used by validate/info, built once
+_MODEL_TAG = f"{{{UML_NAMESPACE}}}Model"
+_INTERACTION_TAG = f"{{{UML_NAMESPACE}}}interaction"
+_LIFELINE_TAG = f"{{{UML_NAMESPACE}}}lifeline"
+_MESSAGE_TAG = f"{{{UML_NAMESPACE}}}message"
+_FRAGMENT_TAG = f"{{{UML_NAMESPACE}}}fragment"
+_PROFILE_APP_TAG = f"{{{UML_NAMESPACE}}}profileApplication"
+_COMMENT_TAG = f"{{{UML_NAMESPACE}}}ownedComment"
+_XMI_ID = f"{{{XMI_NAMESPACE}}}id"
+_XMI_VERSION = f"{{{XMI_NAMESPACE}}}version"
+
+# Elements counted by _scan_xmi
+_COUNTED_TAGS = (
+    _MODEL_TAG,
+    _INTERACTION_TAG,
+    _LIFELINE_TAG,
+    _MESSAGE_TAG,
+    _FRAGMENT_TAG,
+    _PROFILE_APP_TAG,
+    _COMMENT_TAG,
+)
+
+# Number of lifelines/fragments listed by show_info
+_MAX_LISTED = 10
+
+# Prefix of the UUID-based element IDs written by the Rhapsody exporter
+_RHAPSODY_ID_PREFIX = "rhapsody_"
+
+
+def _scan_xmi(source: BinaryIO, detect_uuid: bool = True) -> Dict[str, Any]:
+    """
+    Collect everything validate/info report in a single streaming pass.
+
+    Elements are detached from their parent as soon as they are closed, so
+    memory stays bounded by the nesting depth instead of the file size.
+
+    Args:
+        source: XMI file opened in binary mode
+        detect_uuid: Check element IDs for Rhapsody UUIDs. The check stops at
+            the first match, which for Rhapsody files is the first ID seen.
+
+    Returns:
+        Dictionary with the root tag, XMI version, model name, per-tag
+        element counts, the first lifelines and fragments, and whether
+        Rhapsody UUID-based IDs are used
+
+    Raises:
+        etree.XMLSyntaxError: If the file is not well-formed XML
+    """
+    counts = dict.fromkeys(_COUNTED_TAGS, 0)
+    lifelines: List[Tuple[Optional[str], Optional[str]]] = []
+    fragments: List[Tuple[Optional[str], Optional[str]]] = []
+    root_tag = None
+    xmi_version = None
+    model_name = None
+    check_ids = detect_uuid
+    has_uuid = False
+
+    open_elements = []
+    for event, elem in etree.iterparse(source, events=("start", "end")):
+        if event == "end":
+            open_elements.pop()
+            if open_elements:
+                open_elements[-1].remove(elem)
+            continue
+
+        tag = elem.tag
+        if not open_elements:
+            root_tag = tag
+            xmi_version = elem.get(_XMI_VERSION)
+        elif tag in counts:
+            # Only descendants of the root count, as with root.findall(".//...")
+            counts[tag] += 1
+            if tag == _LIFELINE_TAG:
+                if len(lifelines) < _MAX_LISTED:
+                    lifelines.append((elem.get("name"), elem.get("visibility")))
+            elif tag == _FRAGMENT_TAG:
+                if len(fragments) < _MAX_LISTED:
+                    fragments.append(
+                        (elem.get("interactionOperator"), elem.get("name"))
+                    )
+            elif tag == _MODEL_TAG and counts[tag] == 1:
+                model_name = elem.get("name")
+
+        if check_ids:
+            xmi_id = elem.get(_XMI_ID)
+            if xmi_id is not None and xmi_id.startswith(_RHAPSODY_ID_PREFIX):
+                has_uuid = True
+                check_ids = False
+
+        open_elements.append(elem)
+
+    return {
+        "root_tag": root_tag,
+        "xmi_version": xmi_version,
+        "model_name": model_name,
+        "counts": counts,
+        "lifelines": lifelines,
+        "fragments": fragments,
+        "has_uuid": has_uuid,
+    }
 
 
 def validate_xmi(xmi_file: Path) -> bool:
@@ -34,38 +141,32 @@ def validate_xmi(xmi_file: Path) -> bool:
     """
     try:
         # Parse XML
-        tree = ElementTree.parse(str(xmi_file))
-        root = tree.getroot()
+        with open(xmi_file, "rb") as f:
+            scan = _scan_xmi(f, detect_uuid=False)
+        counts = scan["counts"]
 
         # Check for XMI root element
-        if "XMI" not in root.tag:
+        if "XMI" not in scan["root_tag"]:
             print(f"❌ Invalid XMI file: Missing XMI root element")
             return False
 
         # Check for UML model
-        uml_model = root.find(".//{http://www.eclipse.org/uml2/5.0.0/UML}Model")
-        if uml_model is None:
+        if not counts[_MODEL_TAG]:
             print(f"❌ Invalid XMI file: Missing UML Model element")
             return False
 
         # Check for interaction (sequence diagram)
-        interaction = root.find(".//{http://www.eclipse.org/uml2/5.0.0/UML}interaction")
-        if interaction is None:
+        if not counts[_INTERACTION_TAG]:
             print(f"⚠️  Warning: No interaction element found")
 
-        # Count elements
-        lifelines = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}lifeline")
-        messages = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}message")
-        fragments = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}fragment")
-
         print(f"✅ XMI file appears valid")
-        print(f"   Lifelines: {len(lifelines)}")
-        print(f"   Messages: {len(messages)}")
-        print(f"   Fragments: {len(fragments)}")
+        print(f"   Lifelines: {counts[_LIFELINE_TAG]}")
+        print(f"   Messages: {counts[_MESSAGE_TAG]}")
+        print(f"   Fragments: {counts[_FRAGMENT_TAG]}")
 
         return True
 
-    except ElementTree.ParseError as e:
+    except etree.XMLSyntaxError as e:
         print(f"❌ XML parsing error: {e}")
         return False
     except Exception as e:
@@ -81,64 +182,53 @@ def show_info(xmi_file: Path) -> None:
         xmi_file: Path to XMI file
     """
     try:
-        tree = ElementTree.parse(str(xmi_file))
-        root = tree.getroot()
+        # Size comes from the open handle, so the file is only opened once
+        with open(xmi_file, "rb") as f:
+            size_kb = os.fstat(f.fileno()).st_size / 1024
+            scan = _scan_xmi(f)
+        counts = scan["counts"]
 
         # File size
-        size_kb = xmi_file.stat().st_size / 1024
         print(f"📄 File: {xmi_file}")
         print(f"   Size: {size_kb:.1f} KB")
 
         # XMI version
-        xmi_version = root.get("{http://www.omg.org/spec/XMI/20131001}version")
+        xmi_version = scan["xmi_version"]
         print(f"   XMI Version: {xmi_version or 'Unknown'}")
 
         # Model information
-        model = root.find(".//{http://www.eclipse.org/uml2/5.0.0/UML}Model")
-        if model is not None:
-            model_name = model.get("name")
-            print(f"   Model: {model_name}")
+        if counts[_MODEL_TAG]:
+            print(f"   Model: {scan['model_name']}")
 
         # Lifelines
-        lifelines = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}lifeline")
-        print(f"   Lifelines ({len(lifelines)}):")
-        for lifeline in lifelines[:10]:  # Show first 10
-            name = lifeline.get("name")
-            visibility = lifeline.get("visibility")
+        lifeline_count = counts[_LIFELINE_TAG]
+        print(f"   Lifelines ({lifeline_count}):")
+        for name, visibility in scan["lifelines"]:  # Show first 10
             print(f"      - {name} ({visibility})")
-        if len(lifelines) > 10:
-            print(f"      ... and {len(lifelines) - 10} more")
+        if lifeline_count > _MAX_LISTED:
+            print(f"      ... and {lifeline_count - _MAX_LISTED} more")
 
         # Messages
-        messages = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}message")
-        print(f"   Messages: {len(messages)}")
+        print(f"   Messages: {counts[_MESSAGE_TAG]}")
 
         # Fragments (opt/loop blocks)
-        fragments = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}fragment")
-        if fragments:
-            print(f"   Combined Fragments ({len(fragments)}):")
-            for frag in fragments[:10]:  # Show first 10
-                op = frag.get("interactionOperator")
-                name = frag.get("name")
+        fragment_count = counts[_FRAGMENT_TAG]
+        if fragment_count:
+            print(f"   Combined Fragments ({fragment_count}):")
+            for op, name in scan["fragments"]:  # Show first 10
                 print(f"      - {op} block: {name}")
-            if len(fragments) > 10:
-                print(f"      ... and {len(fragments) - 10} more")
+            if fragment_count > _MAX_LISTED:
+                print(f"      ... and {fragment_count - _MAX_LISTED} more")
 
         # Check for Rhapsody-specific elements
         print(f"   Rhapsody Elements:")
-        has_uuid = any(
-            elem.get("{http://www.omg.org/spec/XMI/20131001}id", "").startswith("rhapsody_")
-            for elem in root.iter()
-        )
-        print(f"      UUID-based IDs: {'Yes' if has_uuid else 'No'}")
+        print(f"      UUID-based IDs: {'Yes' if scan['has_uuid'] else 'No'}")
 
         # Check for profiles
-        profile_apps = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}profileApplication")
-        print(f"      Profile Applications: {len(profile_apps)}")
+        print(f"      Profile Applications: {counts[_PROFILE_APP_TAG]}")
 
         # Check for comments/metadata
-        comments = root.findall(".//{http://www.eclipse.org/uml2/5.0.0/UML}ownedComment")
-        print(f"      Metadata Comments: {len(comments)}")
+        print(f"      Metadata Comments: {counts[_COMMENT_TAG]}")
 
     except Exception as e:
         print(f"❌ Error reading XMI file: {e}")
@@ -161,22 +251,15 @@ def prepare_import(xmi_file: Path, output_dir: Optional[Path] = None) -> None:
     output_file = output_dir / f"{xmi_file.stem}_prepared.xmi"
 
     try:
-        # Parse and re-format XML
-        tree = ElementTree.parse(str(xmi_file))
-
-        # Write with pretty formatting
-        from xml.dom import minidom
-
-        rough_string = ElementTree.tostring(tree.getroot(), encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        pretty_xml = reparsed.toprettyxml(indent="  ")
-
-        # Remove empty lines
-        lines = [line for line in pretty_xml.split("\n") if line.strip()]
-        formatted_xml = "\n".join(lines)
-
-        # Write prepared file
-        output_file.write_text(formatted_xml, encoding="utf-8")
+        # Parse and re-format XML, dropping the original indentation
+        parser = etree.XMLParser(remove_blank_text=True)
+        tree = etree.parse(str(xmi_file), parser)
+
+        # Write prepared file with pretty formatting, serializing straight
+        # to disk instead of through an in-memory copy
+        tree.write(
+            str(output_file), pretty_print=True, xml_declaration=True, encoding="UTF-8"
+        )
 
         print(f"✅ Prepared file created: {output_file}")
         print(f"\n📋 Import Instructions:")
@@ -6,7 +6,7 @@ of function calls, detecting cycles, and collecting statistics.
 """
 
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Set
 
 from ..database.function_database import FunctionDatabase
 from ..database.models import (
@@ -41,6 +41,7 @@ class CallTreeBuilder:
         self.circular_dependencies: List[CircularDependency] = []
         self.max_depth_reached = 0
         self.total_nodes = 0
+        self._file_stem_cache: Dict[Path, str] = {}  # Qualified name prefix per file
 
     def build_tree(
         self,
@@ -276,13 +277,20 @@ class CallTreeBuilder:
         """
         Get qualified name for a function (file::function).
 
+        The file stem is cached per file, as the name is needed for every
+        node visited and many functions share a source file.
+
         Args:
             func_info: Function information
 
         Returns:
             Qualified name string
         """
-        file_stem = Path(func_info.file_path).stem
+        file_path = func_info.file_path
+        file_stem = self._file_stem_cache.get(file_path)
+        if file_stem is None:
+            file_stem = Path(file_path).stem
+            self._file_stem_cache[file_path] = file_stem
         return f"{file_stem}::{func_info.name}"
 
     def get_all_functions_in_tree(self, root: CallTreeNode) -> List[FunctionInfo]:
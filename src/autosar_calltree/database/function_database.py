@@ -14,6 +14,7 @@ Requirements:
 
 import hashlib
 import pickle
+import shutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +28,10 @@ from ..preprocessing import CPPPreprocessor, PreprocessStatistics
 from ..utils.statistics import StatisticsFormatter
 from .models import FunctionInfo
 
+# Version of the cached parse results. Bump it whenever the parsers produce
+# different results for the same source, so older cache entries are not reused
+CACHE_VERSION = 1
+
 
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
@@ -50,6 +55,7 @@ class CacheMetadata:
     file_count: int
     parser_type: str = "pycparser"  # Track which parser created this cache
     file_checksums: Dict[str, str] = field(default_factory=dict)
+    cache_version: int = 0  # CACHE_VERSION the cache was written with
 
 
 class FunctionDatabase:
@@ -90,6 +96,8 @@ class FunctionDatabase:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "function_db.pkl"
+        # Per-file parse results, reused for unchanged files on rebuild
+        self.file_cache_dir = self.cache_dir / "files"
 
         # Database: function_name -> List[FunctionInfo]
         # Multiple entries for functions with same name (static in different files)
@@ -152,6 +160,10 @@ class FunctionDatabase:
                     print(f"Loaded {self.total_functions_found} functions from cache")
                 return
 
+        # A forced rebuild must not reuse per-file parse results either
+        if rebuild_cache:
+            shutil.rmtree(self.file_cache_dir, ignore_errors=True)
+
         # Clear existing data
         self.functions.clear()
         self.qualified_functions.clear()
@@ -162,6 +174,7 @@ class FunctionDatabase:
 
         # Find all C source files
         c_files = list(self.source_dir.rglob("*.c"))
+        file_checksums = self._compute_source_checksums(c_files) if use_cache else {}
 
         if verbose:
             print(f"Found {len(c_files)} C source files")
@@ -174,11 +187,11 @@ class FunctionDatabase:
             self._build_with_two_stage_pipeline(c_files, verbose, preprocess_only)
         else:
             # Fall back to single-stage processing
-            self._build_with_single_stage(c_files, verbose)
+            self._build_with_single_stage(c_files, verbose, file_checksums)
 
         # Save to cache
         if use_cache and not preprocess_only:
-            self._save_to_cache(verbose)
+            self._save_to_cache(verbose, file_checksums)
 
     def _build_with_two_stage_pipeline(
         self,
@@ -249,6 +262,7 @@ class FunctionDatabase:
         self,
         c_files: List[Path],
         verbose: bool,
+        file_checksums: Optional[Dict[str, str]] = None,
     ) -> None:
         """
         Build database using single-stage processing (fallback).
@@ -256,6 +270,8 @@ class FunctionDatabase:
         Args:
             c_files: List of C source files to process
             verbose: Print progress information
+            file_checksums: Source file checksums; when given, parse results
+                are read from and written to the per-file cache
         """
         # Parse each file
         for idx, file_path in enumerate(c_files, 1):
@@ -263,6 +279,10 @@ class FunctionDatabase:
                 f"Processing: [{idx}/{len(c_files)}] {file_path.name} (Size: {_format_file_size(file_path.stat().st_size)})"
             )
 
+            checksum = file_checksums.get(str(file_path)) if file_checksums else None
+            if checksum and self._load_file_from_cache(file_path, checksum):
+                continue
+
             try:
                 self._parse_file(file_path)
             except Exception as e:
@@ -270,6 +290,13 @@ class FunctionDatabase:
                 self.parse_errors.append(error_msg)
                 if verbose:
                     print(f"Warning: {error_msg}")
+                continue
+
+            if checksum:
+                self._save_file_to_cache(file_path, checksum)
+
+        if file_checksums:
+            self._prune_file_cache(file_checksums)
 
         self.total_files_scanned = len(c_files)
 
@@ -568,20 +595,140 @@ class FunctionDatabase:
         except Exception:
             return ""
 
-    def _save_to_cache(self, verbose: bool = False) -> None:
+    def _compute_source_checksums(
+        self, c_files: Optional[List[Path]] = None
+    ) -> Dict[str, str]:
+        """
+        Compute checksums of all C source files.
+
+        Args:
+            c_files: Source files to checksum (default: all .c files in source_dir)
+
+        Returns:
+            Dictionary mapping file path to MD5 checksum
+        """
+        if c_files is None:
+            c_files = list(self.source_dir.rglob("*.c"))
+        return {str(path): self._compute_file_checksum(path) for path in c_files}
+
+    def _file_cache_path(self, file_path: Path, checksum: str) -> Path:
+        """
+        Get the per-file cache entry for a source file.
+
+        The key covers the file path, its content checksum and the cache
+        version, so edited files and parser changes never hit stale entries.
+
+        Args:
+            file_path: Path to source file
+            checksum: Checksum of the file content
+
+        Returns:
+            Path to the cache entry
+        """
+        key = hashlib.md5(
+            f"{CACHE_VERSION}:{file_path}:{checksum}".encode("utf-8")
+        ).hexdigest()
+        return self.file_cache_dir / f"{key}.pkl"
+
+    def _load_file_from_cache(self, file_path: Path, checksum: str) -> bool:
+        """
+        Load the parse result of a single file from the per-file cache.
+
+        Args:
+            file_path: Path to source file
+            checksum: Checksum of the file content
+
+        Returns:
+            True if the file was loaded from cache, False otherwise
+        """
+        entry = self._file_cache_path(file_path, checksum)
+        if not entry.exists():
+            return False
+
+        try:
+            with open(entry, "rb") as f:
+                functions: List[FunctionInfo] = pickle.load(f)
+        except Exception:
+            return False
+
+        for func_info in functions:
+            # Module mapping is reapplied from the current configuration
+            func_info.sw_module = None
+            self._add_function(func_info)
+
+        if functions:
+            self.functions_by_file[str(file_path)] = functions
+
+        return True
+
+    def _save_file_to_cache(self, file_path: Path, checksum: str) -> None:
+        """
+        Save the parse result of a single file to the per-file cache.
+
+        The entry is written to a temporary file and renamed into place so
+        an interrupted run never leaves a truncated entry behind.
+
+        Args:
+            file_path: Path to source file
+            checksum: Checksum of the file content
+        """
+        entry = self._file_cache_path(file_path, checksum)
+        functions = self.functions_by_file.get(str(file_path), [])
+
+        try:
+            self.file_cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_entry = entry.with_suffix(".tmp")
+            with open(temp_entry, "wb") as f:
+                pickle.dump(functions, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_entry.replace(entry)
+        except Exception:
+            pass
+
+    def _prune_file_cache(self, file_checksums: Dict[str, str]) -> None:
+        """
+        Remove per-file cache entries that no current source file uses.
+
+        Entries of edited, moved or deleted files and of older cache versions
+        would otherwise accumulate forever.
+
+        Args:
+            file_checksums: Checksums of the current source files
+        """
+        current_entries = {
+            self._file_cache_path(Path(file_path), checksum).name
+            for file_path, checksum in file_checksums.items()
+        }
+        for entry in self.file_cache_dir.glob("*.pkl"):
+            if entry.name not in current_entries:
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    def _save_to_cache(
+        self,
+        verbose: bool = False,
+        file_checksums: Optional[Dict[str, str]] = None,
+    ) -> None:
         """
         Save database to cache file.
 
         Args:
             verbose: Print progress information
+            file_checksums: Source file checksums (computed if not given)
         """
         try:
+            if file_checksums is None:
+                file_checksums = self._compute_source_checksums()
+
             # Create metadata
             metadata = CacheMetadata(
                 created_at=datetime.now(),
                 source_directory=str(self.source_dir),
                 file_count=self.total_files_scanned,
                 parser_type=self.parser_type,
+                file_checksums=file_checksums,
+                cache_version=CACHE_VERSION,
             )
 
             # Create cache data
@@ -652,6 +799,19 @@ class FunctionDatabase:
                     )
                 return False
 
+            # Check the cache was written by the current parsers
+            if getattr(metadata, "cache_version", 0) != CACHE_VERSION:
+                if verbose:
+                    print("Cache invalid: cache version mismatch")
+                return False
+
+            # Check source files are unchanged since the cache was written
+            cached_checksums = getattr(metadata, "file_checksums", None)
+            if cached_checksums and cached_checksums != self._compute_source_checksums():
+                if verbose:
+                    print("Cache invalid: source files changed")
+                return False
+
             # Load data
             self.functions = cache_data.get("functions", {})
             self.qualified_functions = cache_data.get("qualified_functions", {})
@@ -680,6 +840,7 @@ class FunctionDatabase:
             return False
 
     def clear_cache(self) -> None:
-        """Delete the cache file if it exists."""
+        """Delete the cache file and per-file cache entries if they exist."""
         if self.cache_file.exists():
             self.cache_file.unlink()
+        shutil.rmtree(self.file_cache_dir, ignore_errors=True)
@@ -12,7 +12,7 @@ Requirements:
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..database.models import AnalysisResult, CallTreeNode, FunctionInfo
 from ..utils.tree_formatter import TreeFormatter
@@ -45,6 +45,7 @@ class MermaidGenerator:
         self.include_returns = include_returns
         self.participant_map: Dict[str, str] = {}  # Map full names to abbreviated names
         self.next_participant_id = 1
+        self._file_stem_cache: Dict[Path, str] = {}  # Module fallback per file
 
     def generate(
         self,
@@ -135,10 +136,13 @@ class MermaidGenerator:
         """
         lines = ["sequenceDiagram"]
 
-        # Collect all participants
-        participants = self._collect_participants(root)
+        # Generate sequence calls, collecting participants in the same walk
+        # (the dict keeps them in first-seen order, like _collect_participants)
+        call_lines: List[str] = []
+        participants: Dict[str, None] = {}
+        self._generate_sequence_calls(root, call_lines, participants=participants)
 
-        # Add participant declarations
+        # Add participant declarations ahead of the calls
         for participant in participants:
             if self.abbreviate_rte and participant.startswith("Rte_"):
                 abbrev = self._abbreviate_rte_name(participant)
@@ -148,9 +152,7 @@ class MermaidGenerator:
                 lines.append(f"    participant {participant}")
 
         lines.append("")
-
-        # Generate sequence calls
-        self._generate_sequence_calls(root, lines)
+        lines.extend(call_lines)
 
         return "\n".join(lines)
 
@@ -167,33 +169,37 @@ class MermaidGenerator:
             List of participant names in the order they are first encountered
         """
         participants = []
+        seen = set()
+
+        # Pre-order walk with an explicit stack so deep call chains do not
+        # run into the interpreter's recursion limit
+        stack = [root]
+        while stack:
+            node = stack.pop()
 
-        def traverse(node: CallTreeNode):
             # Use module name if enabled, otherwise use function name
-            if self.use_module_names:
-                # Use module name if available, otherwise fallback to filename
-                participant = (
-                    node.function_info.sw_module
-                    or Path(node.function_info.file_path).stem
-                )
-            else:
-                participant = node.function_info.name
+            participant = self._get_participant_from_node(node)
 
-            # Add participant only if not already in the list
-            if participant not in participants:
+            # Add participant only if not already in the list (set lookup
+            # keeps this linear on wide trees; the list keeps first-seen order)
+            if participant not in seen:
+                seen.add(participant)
                 participants.append(participant)
 
-            for child in node.children:
-                traverse(child)
+            # Push children reversed so they are visited in order
+            stack.extend(reversed(node.children))
 
-        traverse(root)
         return participants
 
     def _generate_sequence_calls(
-        self, node: CallTreeNode, lines: List[str], caller: Optional[str] = None
+        self,
+        node: CallTreeNode,
+        lines: List[str],
+        caller: Optional[str] = None,
+        participants: Optional[Dict[str, None]] = None,
     ) -> None:
         """
-        Generate sequence call statements recursively.
+        Generate sequence call statements for a node and all its descendants.
 
         Implements: SWR_MERMAID_00001 (Module-Based Participants with function names on arrows)
 
@@ -201,24 +207,69 @@ class MermaidGenerator:
             node: Current node in call tree
             lines: List of lines to append to
             caller: Name of calling function or module (None for root)
-        """
-        current_participant = self._get_participant_from_node(node)
-        call_label = self._get_call_label(node)
+            participants: Optional dict that records every participant in
+                first-seen order, so no separate collection pass is needed
+        """
+        # Call labels keyed by id(FunctionInfo): a function called from several
+        # places is labelled once per walk, while its tree is alive
+        call_labels: Dict[int, str] = {}
+
+        def enter(node: CallTreeNode, caller: Optional[str]) -> str:
+            current_participant = self._get_participant_from_node(node)
+            if participants is not None:
+                participants.setdefault(current_participant)
+            call_label = call_labels.get(id(node.function_info))
+            if call_label is None:
+                call_label = self._get_call_label(node)
+                call_labels[id(node.function_info)] = call_label
+
+            # Generate call from caller to current
+            if caller:
+                if node.is_recursive:
+                    label = (
+                        f"{call_label} [recursive]"
+                        if self.use_module_names
+                        else "recursive call"
+                    )
+                    lines.append(f"    {caller}-->>x{current_participant}: {label}")
+                else:
+                    lines.append(f"    {caller}->>{current_participant}: {call_label}")
+
+            return current_participant
+
+        # Depth-first walk with an explicit stack of (node, caller, participant,
+        # remaining children) so deep call chains do not hit the recursion limit;
+        # a frame is closed only after all of its children have been emitted
+        stack: List[Tuple[CallTreeNode, Optional[str], str, Iterator[CallTreeNode]]]
+        stack = [(node, caller, enter(node, caller), iter(node.children))]
+        while stack:
+            current, current_caller, current_participant, children = stack[-1]
+
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+
+                # Generate return from current to caller (only if include_returns is True)
+                if (
+                    current_caller
+                    and not current.is_recursive
+                    and self.include_returns
+                ):
+                    lines.append(
+                        f"    {current_participant}-->>{current_caller}: return"
+                    )
+
+                # Blocks were opened by the parent, so the start node has none to close
+                if stack:
+                    # End opt block for optional calls - SWR_MERMAID_00004
+                    if current.is_optional:
+                        lines.append("    end")
+
+                    # End loop block for loop calls - SWR_MERMAID_00005
+                    if current.is_loop:
+                        lines.append("    end")
+                continue
 
-        # Generate call from caller to current
-        if caller:
-            if node.is_recursive:
-                label = (
-                    f"{call_label} [recursive]"
-                    if self.use_module_names
-                    else "recursive call"
-                )
-                lines.append(f"    {caller}-->>x{current_participant}: {label}")
-            else:
-                lines.append(f"    {caller}->>{current_participant}: {call_label}")
-
-        # Generate calls to children
-        for child in node.children:
             # Start loop block for loop calls - SWR_MERMAID_00005: Loop Block Generation
             if child.is_loop:
                 loop_text = child.loop_condition if child.loop_condition else "Loop"
@@ -229,19 +280,14 @@ class MermaidGenerator:
                 condition_text = child.condition if child.condition else "Optional call"
                 lines.append(f"    opt {condition_text}")
 
-            self._generate_sequence_calls(child, lines, current_participant)
-
-            # End opt block for optional calls - SWR_MERMAID_00004
-            if child.is_optional:
-                lines.append("    end")
-
-            # End loop block for loop calls - SWR_MERMAID_00005
-            if child.is_loop:
-                lines.append("    end")
-
-        # Generate return from current to caller (only if include_returns is True)
-        if caller and not node.is_recursive and self.include_returns:
-            lines.append(f"    {current_participant}-->>{caller}: return")
+            stack.append(
+                (
+                    child,
+                    current_participant,
+                    enter(child, current_participant),
+                    iter(child.children),
+                )
+            )
 
     def _get_participant_name(self, function_name: str) -> str:
         """
@@ -266,11 +312,32 @@ class MermaidGenerator:
             Participant name (function name or module name)
         """
         if self.use_module_names:
-            return (
-                node.function_info.sw_module or Path(node.function_info.file_path).stem
-            )
+            return self._get_module_name(node.function_info)
         return node.function_info.name
 
+    def _get_module_name(self, function_info: FunctionInfo) -> str:
+        """
+        Get module name for a function, falling back to its file name.
+
+        The file name fallback is cached per file, as many functions share
+        a source file and the name is needed on every visit.
+
+        Args:
+            function_info: Function information
+
+        Returns:
+            SW module name, or the source file stem if no module is mapped
+        """
+        if function_info.sw_module:
+            return function_info.sw_module
+
+        file_path = function_info.file_path
+        stem = self._file_stem_cache.get(file_path)
+        if stem is None:
+            stem = Path(file_path).stem
+            self._file_stem_cache[file_path] = stem
+        return stem
+
     def _get_call_label(self, node: CallTreeNode) -> str:
         """
         Get the call label for a node.
@@ -342,14 +409,13 @@ class MermaidGenerator:
         functions = []
         seen = set()
 
-        def traverse(node: CallTreeNode):
+        stack = [root]
+        while stack:
+            node = stack.pop()
             if node.function_info.name not in seen:
                 seen.add(node.function_info.name)
                 functions.append(node.function_info)
-            for child in node.children:
-                traverse(child)
-
-        traverse(root)
+            stack.extend(reversed(node.children))
 
         # Sort by function name
         functions.sort(key=lambda f: f.name)
@@ -15,8 +15,9 @@ Requirements:
 - SWR_RH_00005: Rhapsody-specific Metadata
 """
 
+from itertools import count
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from lxml import etree
@@ -70,6 +71,18 @@ class RhapsodyXmiGenerator:
     )
     PREDEFINED_TYPES_NAMESPACE = "http://RhapsodyStandardModel.PredefinedTypes/schemas/PredefinedTypes_profile/_doliZBVTEfGCaP-TK4cK4g/0"
 
+    # Namespace-qualified names, formatted once instead of per element
+    _XMI_ID = f"{{{XMI_NAMESPACE}}}id"
+    _XMI_TYPE = f"{{{XMI_NAMESPACE}}}type"
+    _XMI_VERSION = f"{{{XMI_NAMESPACE}}}version"
+    _TAG_EXTENSION = f"{{{XMI_NAMESPACE}}}Extension"
+    _TAG_MODEL = f"{{{UML_NAMESPACE}}}Model"
+
+    XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+    # Output buffer, so lxml's serialized chunks reach disk in few large writes
+    _WRITE_BUFFER_SIZE = 1 << 20
+
     RHP_VERSION = "10.0.1"
     MAX_PACKAGE_DEPTH = 30
     MAX_PACKAGE_NAME_LENGTH = 50
@@ -90,6 +103,17 @@ class RhapsodyXmiGenerator:
         self.package_path = self._validate_package_path(package_path) if package_path else None
         self.model_name = model_name
 
+        # SWR_RH_00004: One random UUID per generator supplies the first 80 bits
+        # of every element ID; the last 48 bits count up from there
+        self._id_prefix = str(uuid4())[:24]
+        self._id_counter = count()
+
+        # One shared ":Module" participant string per SW module
+        self._module_participants: Dict[str, str] = {}
+
+        # Message signatures keyed by id(FunctionInfo), reset per document
+        self._signature_cache: Dict[int, str] = {}
+
     def _validate_package_path(self, package_path: str) -> str:
         """
         Validate package path format and constraints.
@@ -161,10 +185,12 @@ class RhapsodyXmiGenerator:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file with proper encoding
-        xml_string = self._element_to_string(root)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(xml_string)
+        # Serialize straight into the file through lxml's incremental writer
+        # instead of materializing the whole document as a string first
+        with open(output_file, "wb", buffering=self._WRITE_BUFFER_SIZE) as f:
+            f.write(self.XML_DECLARATION.encode("utf-8"))
+            with etree.xmlfile(f, encoding="UTF-8") as xf:
+                xf.write(root, pretty_print=True)
 
     def generate_to_string(self, result: AnalysisResult) -> str:
         """
@@ -199,19 +225,20 @@ class RhapsodyXmiGenerator:
         xml_str = etree.tostring(element, encoding="unicode", pretty_print=True)
 
         # Add XML declaration
-        return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
+        return f"{self.XML_DECLARATION}{xml_str}"
 
     def _generate_id(self) -> str:
         """
         Generate Rhapsody-compatible UUID-based IDs.
 
-        Rhapsody uses GUID+<UUID> format for element IDs.
+        Rhapsody uses GUID+<UUID> format for element IDs. IDs keep the UUID
+        layout but only the prefix is random, so no entropy is read per element.
 
         Returns:
             Unique identifier string with GUID+<UUID> format
         """
         # SWR_RH_00004: UUID-based Element IDs (GUID+ format)
-        return f"GUID+{uuid4()}"
+        return f"GUID+{self._id_prefix}{next(self._id_counter):012x}"
 
     def _generate_xmi_document(
         self, result: AnalysisResult, call_tree: CallTreeNode
@@ -226,6 +253,10 @@ class RhapsodyXmiGenerator:
         Returns:
             Root XMI element with complete document structure
         """
+        # Call trees only live for one document, so keyed signatures must not
+        # outlive it (ids can be reused once FunctionInfo objects are freed)
+        self._signature_cache = {}
+
         # SWR_RH_00001: XMI 2.1 Compatibility
         # Create namespace map for lxml
         nsmap = {
@@ -240,12 +271,13 @@ class RhapsodyXmiGenerator:
         }
 
         root = Element("XMI", nsmap=nsmap)
-        root.set(f"{{{self.XMI_NAMESPACE}}}version", "2.1")
+        root.set(self._XMI_VERSION, "2.1")
 
         # Create UML model - use prefixed form to force xmlns:uml declaration
-        model = SubElement(root, "{http://www.omg.org/spec/UML/20090901}Model")
-        model.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Model")
-        model.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+        model = SubElement(root, self._TAG_MODEL)
+        model.set(self._XMI_TYPE, "uml:Model")
+        model_id = self._generate_id()
+        model.set(self._XMI_ID, model_id)
         model.set("name", self.model_name if self.model_name else f"CallTree_{result.root_function}")
 
         # Add element imports
@@ -253,10 +285,10 @@ class RhapsodyXmiGenerator:
 
         # Add model constraint
         constraint = SubElement(model, "ownedRule")
-        constraint.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Constraint")
-        constraint.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+        constraint.set(self._XMI_TYPE, "uml:Constraint")
+        constraint.set(self._XMI_ID, self._generate_id())
         constraint.set("name", "Model1")
-        constraint.set("context", model.get(f"{{{self.XMI_NAMESPACE}}}id"))
+        constraint.set("context", model_id)
 
         # Add profile applications
         self._add_rhapsody_profiles(model)
@@ -276,27 +308,27 @@ class RhapsodyXmiGenerator:
                     continue
 
                 pkg = SubElement(current_package, "packagedElement")
-                pkg.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Package")
-                pkg.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+                pkg.set(self._XMI_TYPE, "uml:Package")
+                pkg.set(self._XMI_ID, self._generate_id())
                 pkg.set("name", pkg_name)
                 current_package = pkg
 
             # The sequence diagram package is the last one
             package = SubElement(current_package, "packagedElement")
-            package.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Package")
-            package.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+            package.set(self._XMI_TYPE, "uml:Package")
+            package.set(self._XMI_ID, self._generate_id())
             package.set("name", "Sequence_Diagram")
         else:
             # Use flat package structure (current implementation)
             package = SubElement(model, "packagedElement")
-            package.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Package")
-            package.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+            package.set(self._XMI_TYPE, "uml:Package")
+            package.set(self._XMI_ID, self._generate_id())
             package.set("name", "Sequence_Diagram")
 
         # Create interaction
         interaction = SubElement(package, "packagedElement")
-        interaction.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Interaction")
-        interaction.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+        interaction.set(self._XMI_TYPE, "uml:Interaction")
+        interaction.set(self._XMI_ID, self._generate_id())
         interaction.set("name", f"seq_{result.root_function}")
 
         # Collect participants (lifelines)
@@ -323,27 +355,23 @@ class RhapsodyXmiGenerator:
         Returns:
             Dictionary mapping participant names to their display names
         """
-        participants = {}
+        participants: Dict[str, str] = {}
 
-        def traverse(node: CallTreeNode):
+        # Depth-first pre-order walk with an explicit stack (no recursion limit)
+        stack = [call_tree]
+        while stack:
+            node = stack.pop()
             if node.is_recursive:
-                return
-
-            # Determine participant name
-            if self.use_module_names and node.function_info.sw_module:
-                name = f":{node.function_info.sw_module}"
-            else:
-                name = node.function_info.name
+                continue
 
             # Store first occurrence of each participant
+            name = self._get_participant_name(node.function_info)
             if name not in participants:
                 participants[name] = name
 
-            # Traverse children
-            for child in node.children:
-                traverse(child)
+            # Push children reversed so they are visited in order
+            stack.extend(reversed(node.children))
 
-        traverse(call_tree)
         return participants
 
     def _create_role_definitions(
@@ -363,12 +391,18 @@ class RhapsodyXmiGenerator:
 
         for name in participants.values():
             # Create role definition
-            role = SubElement(interaction, "ownedAttribute")
-            role.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Property")
-            role.set(f"{{{self.XMI_NAMESPACE}}}id", f"{self._generate_id()}_Role")
-            role.set("name", f"{name}Role")
+            role_id = f"{self._generate_id()}_Role"
+            SubElement(
+                interaction,
+                "ownedAttribute",
+                {
+                    self._XMI_TYPE: "uml:Property",
+                    self._XMI_ID: role_id,
+                    "name": f"{name}Role",
+                },
+            )
 
-            role_ids[name] = role.get(f"{{{self.XMI_NAMESPACE}}}id")
+            role_ids[name] = role_id
 
         return role_ids
 
@@ -390,24 +424,23 @@ class RhapsodyXmiGenerator:
             Dictionary mapping participant names to lifeline elements
         """
         lifeline_elements = {}
+        interaction_id = interaction.get(self._XMI_ID)
 
         for name in participants.values():
-            # Create lifeline
-            lifeline = SubElement(interaction, "lifeline")
-            lifeline.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Lifeline")
-            lifeline.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
-            lifeline.set("name", name)
-
-            # Reference role
-            lifeline.set("represents", role_ids[name])
-
-            # Reference interaction
-            lifeline.set("interaction", interaction.get(f"{{{self.XMI_NAMESPACE}}}id"))
-
-            # Initialize coveredBy (will be updated later)
-            lifeline.set("coveredBy", "")
-
-            lifeline_elements[name] = lifeline
+            # Create lifeline referencing its role and the interaction;
+            # coveredBy is filled in once the messages are created
+            lifeline_elements[name] = SubElement(
+                interaction,
+                "lifeline",
+                {
+                    self._XMI_TYPE: "uml:Lifeline",
+                    self._XMI_ID: self._generate_id(),
+                    "name": name,
+                    "represents": role_ids[name],
+                    "interaction": interaction_id,
+                    "coveredBy": "",
+                },
+            )
 
         return lifeline_elements
 
@@ -430,101 +463,118 @@ class RhapsodyXmiGenerator:
             name: [] for name in lifeline_elements.keys()
         }
 
+        # Attribute names and helpers are used for every message; bind them
+        # once instead of looking them up on self (or globally) each time
+        xmi_id = self._XMI_ID
+        xmi_type = self._XMI_TYPE
+        generate_id = self._generate_id
+        get_participant_name = self._get_participant_name
+        format_signature = self._format_message_signature
+        sub_element = SubElement
+
+        # IDs referenced by every message, read from the tree once up front
+        interaction_id = interaction.get(xmi_id)
+        lifeline_ids = {
+            name: lifeline.get(xmi_id) for name, lifeline in lifeline_elements.items()
+        }
+
         # Track message index for sequencing
         message_index = 0
 
-        def traverse(node: CallTreeNode, depth: int):
-            nonlocal message_index
-
-            if node.is_recursive:
-                return
-
-            # Determine source participant
-            source_name = self._get_participant_name(node.function_info)
-
-            # Process each child call
-            for child in node.children:
-                if child.is_recursive:
-                    continue
-
-                # Determine target participant
-                target_name = self._get_participant_name(child.function_info)
-
-                # Generate message ID
-                message_id = self._generate_id()
-
-                # Create message occurrence specifications
-                source_occ_id = f"{message_id}_source_MessageOccurrenceSpecification"
-                target_occ_id = f"{message_id}_target_MessageOccurrenceSpecification"
-
-                # Create source occurrence
-                source_occ = SubElement(interaction, "fragment")
-                source_occ.set(
-                    f"{{{self.XMI_NAMESPACE}}}type",
-                    "uml:MessageOccurrenceSpecification",
-                )
-                source_occ.set(f"{{{self.XMI_NAMESPACE}}}id", source_occ_id)
-                source_occ.set(
-                    "covered",
-                    lifeline_elements[source_name].get(f"{{{self.XMI_NAMESPACE}}}id"),
+        # Depth-first walk with an explicit stack of (source participant,
+        # remaining children) so each child's calls are emitted right after
+        # its own message, exactly as a recursive pre-order traversal would
+        stack: List[Tuple[str, Iterator[CallTreeNode]]] = []
+        if not call_tree.is_recursive:
+            stack.append(
+                (
+                    get_participant_name(call_tree.function_info),
+                    iter(call_tree.children),
                 )
-                source_occ.set(
-                    "enclosingInteraction",
-                    interaction.get(f"{{{self.XMI_NAMESPACE}}}id"),
-                )
-                source_occ.set("message", message_id)
+            )
 
-                # Create target occurrence
-                target_occ = SubElement(interaction, "fragment")
-                target_occ.set(
-                    f"{{{self.XMI_NAMESPACE}}}type",
-                    "uml:MessageOccurrenceSpecification",
-                )
-                target_occ.set(f"{{{self.XMI_NAMESPACE}}}id", target_occ_id)
-                target_occ.set(
-                    "covered",
-                    lifeline_elements[target_name].get(f"{{{self.XMI_NAMESPACE}}}id"),
-                )
-                target_occ.set(
-                    "enclosingInteraction",
-                    interaction.get(f"{{{self.XMI_NAMESPACE}}}id"),
-                )
-                target_occ.set("message", message_id)
-
-                # Track occurrences for coveredBy update
-                lifeline_occurrences[source_name].append(source_occ_id)
-                lifeline_occurrences[target_name].append(target_occ_id)
-
-                # Create message element
-                message = SubElement(interaction, "message")
-                message.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Message")
-                message.set(f"{{{self.XMI_NAMESPACE}}}id", message_id)
-                message.set("name", child.function_info.name)
-                message.set("receiveEvent", target_occ_id)
-                message.set("sendEvent", source_occ_id)
-                message.set(
-                    "interaction", interaction.get(f"{{{self.XMI_NAMESPACE}}}id")
-                )
-                message.set("messageSort", "synchCall")
+        while stack:
+            source_name, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+            if child.is_recursive:
+                continue
+
+            # Determine target participant
+            target_name = get_participant_name(child.function_info)
+
+            # Generate message ID
+            message_id = generate_id()
+
+            # Create message occurrence specifications
+            source_occ_id = f"{message_id}_source_MessageOccurrenceSpecification"
+            target_occ_id = f"{message_id}_target_MessageOccurrenceSpecification"
+
+            # Create source occurrence (attributes passed in one call rather
+            # than set one by one)
+            sub_element(
+                interaction,
+                "fragment",
+                {
+                    xmi_type: "uml:MessageOccurrenceSpecification",
+                    xmi_id: source_occ_id,
+                    "covered": lifeline_ids[source_name],
+                    "enclosingInteraction": interaction_id,
+                    "message": message_id,
+                },
+            )
 
-                # Add signature if available
-                signature = self._format_message_signature(child.function_info)
-                if signature:
-                    message.set("signature", signature)
+            # Create target occurrence
+            sub_element(
+                interaction,
+                "fragment",
+                {
+                    xmi_type: "uml:MessageOccurrenceSpecification",
+                    xmi_id: target_occ_id,
+                    "covered": lifeline_ids[target_name],
+                    "enclosingInteraction": interaction_id,
+                    "message": message_id,
+                },
+            )
 
+            # Track occurrences for coveredBy update
+            lifeline_occurrences[source_name].append(source_occ_id)
+            lifeline_occurrences[target_name].append(target_occ_id)
+
+            # Create message element
+            message_attrib = {
+                xmi_type: "uml:Message",
+                xmi_id: message_id,
+                "name": child.function_info.name,
+                "receiveEvent": target_occ_id,
+                "sendEvent": source_occ_id,
+                "interaction": interaction_id,
+                "messageSort": "synchCall",
+            }
+
+            # Add signature if available
+            signature = format_signature(child.function_info)
+            if signature:
+                message_attrib["signature"] = signature
+
+            message_index += 1
+
+            # Handle conditional blocks (opt/loop/alt): the message goes
+            # straight into the fragment's operand instead of being created
+            # on the interaction and moved there afterwards
+            message_parent = interaction
+            if child.is_optional or child.is_loop:
+                message_parent = self._create_combined_fragment(
+                    interaction, child, message_index, lifeline_elements
+                )
                 message_index += 1
 
-                # Handle conditional blocks (opt/loop/alt)
-                if child.is_optional or child.is_loop:
-                    self._create_combined_fragment(
-                        interaction, child, message, message_index, lifeline_elements
-                    )
-                    message_index += 1
-
-                # Recursively process children
-                traverse(child, depth + 1)
+            sub_element(message_parent, "message", message_attrib)
 
-        traverse(call_tree, 0)
+            # Descend into the callee before its next sibling
+            stack.append((target_name, iter(child.children)))
 
         # Update coveredBy attributes on lifelines
         for name, occurrences in lifeline_occurrences.items():
@@ -542,39 +592,53 @@ class RhapsodyXmiGenerator:
             Participant name (module name or function name)
         """
         if self.use_module_names and function_info.sw_module:
-            return f":{function_info.sw_module}"
+            sw_module = function_info.sw_module
+            name = self._module_participants.get(sw_module)
+            if name is None:
+                name = f":{sw_module}"
+                self._module_participants[sw_module] = name
+            return name
         return function_info.name
 
     def _format_message_signature(self, function_info: FunctionInfo) -> str:
         """
         Format function signature for message.
 
+        Functions called from several places in the tree are formatted once
+        per document.
+
         Args:
             function_info: Function information
 
         Returns:
             Formatted signature string
         """
-        params = ", ".join(p.name for p in function_info.parameters)
-        return f"{function_info.name}({params})"
+        key = id(function_info)
+        signature = self._signature_cache.get(key)
+        if signature is None:
+            params = ", ".join(p.name for p in function_info.parameters)
+            signature = f"{function_info.name}({params})"
+            self._signature_cache[key] = signature
+        return signature
 
     def _create_combined_fragment(
         self,
         interaction: Element,
         node: CallTreeNode,
-        message: Element,
         index: int,
         lifeline_elements: Dict[str, Element],
-    ) -> None:
+    ) -> Element:
         """
         Create combined fragment for conditional or loop blocks.
 
         Args:
             interaction: Interaction element
             node: Call tree node with conditional/loop flag
-            message: Message element to wrap
             index: Message index
             lifeline_elements: Dictionary of lifeline elements
+
+        Returns:
+            Operand element that receives the wrapped message
         """
         # Determine operator
         if node.is_loop:
@@ -585,19 +649,22 @@ class RhapsodyXmiGenerator:
             condition = node.condition or "condition"
 
         # Create combined fragment
-        fragment = SubElement(interaction, "fragment")
-        fragment.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:CombinedFragment")
-        fragment.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
-        fragment.set("interactionOperator", operator)
+        fragment = SubElement(
+            interaction,
+            "fragment",
+            {
+                self._XMI_TYPE: "uml:CombinedFragment",
+                self._XMI_ID: self._generate_id(),
+                "interactionOperator": operator,
+            },
+        )
 
         # Create operand
-        operand = SubElement(fragment, "operand")
-        operand.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
-        operand.set("name", condition)
-
-        # Add message to operand (reparent from interaction)
-        interaction.remove(message)
-        operand.append(message)
+        return SubElement(  # type: ignore[no-any-return]
+            fragment,
+            "operand",
+            {self._XMI_ID: self._generate_id(), "name": condition},
+        )
 
     def _add_element_imports(self, model: Element) -> None:
         """
@@ -612,15 +679,14 @@ class RhapsodyXmiGenerator:
             ("GUID+RhpProperties_Package_packagedElement_2148", "RhpProperties"),
             ("GUID+RhpProperties_Package_packagedElement_81114", "CG"),
         ]
+        model_id = model.get(self._XMI_ID)
 
         for elem_id, name in imports:
             elem_import = SubElement(model, "elementImport")
-            elem_import.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:ElementImport")
-            elem_import.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+            elem_import.set(self._XMI_TYPE, "uml:ElementImport")
+            elem_import.set(self._XMI_ID, self._generate_id())
             elem_import.set("importedElement", elem_id)
-            elem_import.set(
-                "importingNamespace", model.get(f"{{{self.XMI_NAMESPACE}}}id")
-            )
+            elem_import.set("importingNamespace", model_id)
 
     def _add_rhapsody_profiles(self, model: Element) -> None:
         """
@@ -644,27 +710,28 @@ class RhapsodyXmiGenerator:
                 "GUID+RhpProperties_Package_packagedElement_2148_eAnnotations_0_contents_0",
             ),
         ]
+        model_id = model.get(self._XMI_ID)
 
         for app_id, profile_id, epackage_id in profile_apps:
             profile_app = SubElement(model, "profileApplication")
-            profile_app.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:ProfileApplication")
-            profile_app.set(f"{{{self.XMI_NAMESPACE}}}id", app_id)
+            profile_app.set(self._XMI_TYPE, "uml:ProfileApplication")
+            profile_app.set(self._XMI_ID, app_id)
             profile_app.set("appliedProfile", profile_id)
-            profile_app.set("applyingPackage", model.get(f"{{{self.XMI_NAMESPACE}}}id"))
+            profile_app.set("applyingPackage", model_id)
 
             # Add xmi:Extension - use {namespace}tag format
-            extension = SubElement(profile_app, f"{{{self.XMI_NAMESPACE}}}Extension")
+            extension = SubElement(profile_app, self._TAG_EXTENSION)
             extension.set("extender", self.ECORE_NAMESPACE)
 
             # Add eAnnotations
             eannot = SubElement(extension, "eAnnotations")
-            eannot.set(f"{{{self.XMI_NAMESPACE}}}type", "ecore:EAnnotation")
-            eannot.set(f"{{{self.XMI_NAMESPACE}}}id", f"{app_id}_eAnnotations_0")
+            eannot.set(self._XMI_TYPE, "ecore:EAnnotation")
+            eannot.set(self._XMI_ID, f"{app_id}_eAnnotations_0")
             eannot.set("source", "http://www.eclipse.org/uml2/2.0.0/UML")
 
             # Add references
             references = SubElement(eannot, "references")
-            references.set(f"{{{self.XMI_NAMESPACE}}}type", "ecore:EPackage")
+            references.set(self._XMI_TYPE, "ecore:EPackage")
             references.set("href", epackage_id)
 
     def _add_rhapsody_metadata(self, model: Element, result: AnalysisResult) -> None:
@@ -679,8 +746,8 @@ class RhapsodyXmiGenerator:
 
         # Add tool comment
         comment = SubElement(model, "ownedComment")
-        comment.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Comment")
-        comment.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+        comment.set(self._XMI_TYPE, "uml:Comment")
+        comment.set(self._XMI_ID, self._generate_id())
 
         body = SubElement(comment, "body")
         body.text = (
@@ -692,8 +759,8 @@ class RhapsodyXmiGenerator:
 
         # Add Rhapsody settings comment
         settings = SubElement(model, "ownedComment")
-        settings.set(f"{{{self.XMI_NAMESPACE}}}type", "uml:Comment")
-        settings.set(f"{{{self.XMI_NAMESPACE}}}id", self._generate_id())
+        settings.set(self._XMI_TYPE, "uml:Comment")
+        settings.set(self._XMI_ID, self._generate_id())
 
         settings_body = SubElement(settings, "body")
         settings_body.text = (
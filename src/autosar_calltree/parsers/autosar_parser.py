@@ -8,8 +8,10 @@ Parses AUTOSAR macro-based function declarations like:
 """
 
 import re
+from dataclasses import astuple
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
 from ..database.models import FunctionInfo, FunctionType, Parameter
 
@@ -17,6 +19,19 @@ from ..database.models import FunctionInfo, FunctionType, Parameter
 class AutosarParser:
     """Parse AUTOSAR-specific function declarations."""
 
+    # Instances only hold the bound pattern methods and the parameter cache
+    # set up in __init__
+    __slots__ = (
+        "_declaration_search",
+        "_p2var_search",
+        "_p2const_search",
+        "_var_search",
+        "_const_search",
+        "_param_delimiters",
+        "_remove_const_keywords",
+        "_cached_parameter_fields",
+    )
+
     # AUTOSAR function patterns
     FUNC_PATTERN = re.compile(
         r"(STATIC\s+)?FUNC\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)\s+(\w+)\s*\(", re.MULTILINE
@@ -32,6 +47,23 @@ class AutosarParser:
         re.MULTILINE,
     )
 
+    # The three function patterns as one alternation, so a line is searched
+    # once. Each alternative ends with its function name group, so the
+    # match's lastindex tells which macro matched
+    FUNCTION_DECLARATION_PATTERN = re.compile(
+        "|".join(
+            pattern.pattern
+            for pattern in (FUNC_PATTERN, FUNC_P2VAR_PATTERN, FUNC_P2CONST_PATTERN)
+        ),
+        re.MULTILINE,
+    )
+    # lastindex -> (offset of the alternative's groups, function type, macro)
+    _DECLARATION_MACROS = {
+        4: (0, FunctionType.AUTOSAR_FUNC, "FUNC"),
+        9: (4, FunctionType.AUTOSAR_FUNC_P2VAR, "FUNC_P2VAR"),
+        14: (9, FunctionType.AUTOSAR_FUNC_P2CONST, "FUNC_P2CONST"),
+    }
+
     # Parameter patterns
     # Note: Order matters! More specific patterns (P2VAR, P2CONST) must be checked
     # before less specific ones (VAR, CONST) to prevent false matches
@@ -45,6 +77,34 @@ class AutosarParser:
     VAR_PATTERN = re.compile(r"(?<!P2)VAR\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)\s+(\w+)")
     CONST_PATTERN = re.compile(r"(?<!P2)CONST\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)\s+(\w+)")
 
+    # Parameter list delimiters: a parenthesis or comma
+    PARAM_DELIMITER_PATTERN = re.compile(r"[(),]")
+
+    # The const qualifier as a whole word, so types such as constant_t and
+    # names such as reconstruct are left intact
+    CONST_KEYWORD_PATTERN = re.compile(r"\bconst\b")
+
+    # Number of distinct parameter strings whose parse results are kept
+    PARAMETER_CACHE_SIZE = 1024
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        # Bind the search methods of the patterns once, as they are called for
+        # every candidate line and parameter
+        self._declaration_search = self.FUNCTION_DECLARATION_PATTERN.search
+        self._p2var_search = self.P2VAR_PATTERN.search
+        self._p2const_search = self.P2CONST_PATTERN.search
+        self._var_search = self.VAR_PATTERN.search
+        self._const_search = self.CONST_PATTERN.search
+        self._param_delimiters = self.PARAM_DELIMITER_PATTERN.finditer
+        self._remove_const_keywords = self.CONST_KEYWORD_PATTERN.subn
+        # Parsed parameter fields by parameter string; generated code repeats
+        # the same parameter lists across many functions. Bounded, as a
+        # CParser keeps its parser for its whole lifetime
+        self._cached_parameter_fields = lru_cache(maxsize=self.PARAMETER_CACHE_SIZE)(
+            self._parse_parameter_fields
+        )
+
     def parse_function_declaration(
         self, line: str, file_path: Path, line_number: int
     ) -> Optional[FunctionInfo]:
@@ -59,42 +119,27 @@ class AutosarParser:
         Returns:
             FunctionInfo object or None if not a function declaration
         """
-        # Try FUNC pattern
-        match = self.FUNC_PATTERN.search(line)
-        if match:
-            return self._create_function_info_from_match(
-                match, line, file_path, line_number, FunctionType.AUTOSAR_FUNC, "FUNC"
-            )
-
-        # Try FUNC_P2VAR pattern
-        match = self.FUNC_P2VAR_PATTERN.search(line)
-        if match:
-            return self._create_function_info_from_match(
-                match,
-                line,
-                file_path,
-                line_number,
-                FunctionType.AUTOSAR_FUNC_P2VAR,
-                "FUNC_P2VAR",
-            )
-
-        # Try FUNC_P2CONST pattern
-        match = self.FUNC_P2CONST_PATTERN.search(line)
-        if match:
-            return self._create_function_info_from_match(
-                match,
-                line,
-                file_path,
-                line_number,
-                FunctionType.AUTOSAR_FUNC_P2CONST,
-                "FUNC_P2CONST",
-            )
-
-        return None
+        # Most lines are not declarations; reject them without running the regex
+        if "FUNC" not in line:
+            return None
+
+        match = self._declaration_search(line)
+        if not match:
+            return None
+
+        offset, function_type, macro_type = self._DECLARATION_MACROS[match.lastindex]
+        return self._create_function_info_from_match(
+            match.groups()[offset : match.lastindex],
+            line,
+            file_path,
+            line_number,
+            function_type,
+            macro_type,
+        )
 
     def _create_function_info_from_match(
         self,
-        match,
+        groups: Tuple[Any, ...],
         line: str,
         file_path: Path,
         line_number: int,
@@ -102,10 +147,10 @@ class AutosarParser:
         macro_type: str,
     ) -> FunctionInfo:
         """
-        Create FunctionInfo from regex match.
+        Create FunctionInfo from the groups of a matched declaration macro.
 
         Args:
-            match: Regex match object
+            groups: Match groups of the macro's pattern alternative
             line: Original line of code
             file_path: Path to source file
             line_number: Line number in file
@@ -115,7 +160,6 @@ class AutosarParser:
         Returns:
             FunctionInfo object
         """
-        groups = match.groups()
         is_static_str = groups[0]
         return_type = groups[1].strip()
         func_name = groups[-1]  # Last group is always function name
@@ -165,21 +209,24 @@ class AutosarParser:
         if paren_start == -1:
             return ""
 
-        # Find matching closing parenthesis
+        # Find matching closing parenthesis, or run to the end of the line
+        # if it is missing, and slice the parameters out in one go. Only the
+        # delimiters are visited, not every character in between
         paren_depth = 0
-        param_chars = []
+        param_end = len(line)
 
-        for char in line[paren_start:]:
-            param_chars.append(char)
+        for delimiter in self._param_delimiters(line, paren_start):
+            char = delimiter.group()
             if char == "(":
                 paren_depth += 1
             elif char == ")":
                 paren_depth -= 1
                 if paren_depth == 0:
+                    param_end = delimiter.end()
                     break
 
         # Remove outer parentheses
-        param_string = "".join(param_chars)
+        param_string = line[paren_start:param_end]
         if param_string.startswith("(") and param_string.endswith(")"):
             param_string = param_string[1:-1]
 
@@ -189,12 +236,26 @@ class AutosarParser:
         """
         Parse function parameters (both AUTOSAR and traditional).
 
+        Results are cached per parameter string as immutable field tuples, and
+        every call gets new Parameter objects built from them.
+
         Args:
             param_string: Parameter list string (inside parentheses)
 
         Returns:
             List of Parameter objects
         """
+        return [
+            Parameter(*fields)
+            for fields in self._cached_parameter_fields(param_string)
+        ]
+
+    def _parse_parameter_fields(self, param_string: str) -> Tuple[Tuple[Any, ...], ...]:
+        """Parse function parameters into Parameter field tuples."""
+        return tuple(astuple(param) for param in self._parse_parameters(param_string))
+
+    def _parse_parameters(self, param_string: str) -> List[Parameter]:
+        """Parse function parameters without consulting the cache."""
         if not param_string or param_string.strip() in ("void", ""):
             return []
 
@@ -216,8 +277,12 @@ class AutosarParser:
 
     def _parse_single_parameter(self, param_str: str) -> Optional[Parameter]:
         """Parse a single parameter."""
+        # Each pattern needs its macro name followed by "(", so a substring
+        # check skips the searches that cannot match (all of them for
+        # traditional C parameters)
+
         # Try P2VAR pattern first (more specific)
-        match = self.P2VAR_PATTERN.search(param_str)
+        match = "P2VAR(" in param_str and self._p2var_search(param_str)
         if match:
             param_type, ptr_class, memory_class, name = match.groups()
             return Parameter(
@@ -229,7 +294,7 @@ class AutosarParser:
             )
 
         # Try P2CONST pattern (more specific)
-        match = self.P2CONST_PATTERN.search(param_str)
+        match = "P2CONST(" in param_str and self._p2const_search(param_str)
         if match:
             param_type, ptr_class, memory_class, name = match.groups()
             return Parameter(
@@ -241,7 +306,7 @@ class AutosarParser:
             )
 
         # Try VAR pattern (less specific)
-        match = self.VAR_PATTERN.search(param_str)
+        match = "VAR(" in param_str and self._var_search(param_str)
         if match:
             param_type, memory_class, name = match.groups()
             return Parameter(
@@ -253,7 +318,7 @@ class AutosarParser:
             )
 
         # Try CONST pattern (less specific)
-        match = self.CONST_PATTERN.search(param_str)
+        match = "CONST(" in param_str and self._const_search(param_str)
         if match:
             param_type, memory_class, name = match.groups()
             return Parameter(
@@ -269,67 +334,63 @@ class AutosarParser:
 
     def _parse_traditional_parameter(self, param_str: str) -> Optional[Parameter]:
         """Parse traditional C parameter format."""
-        param_str = param_str.strip()
-
         # Check for const
-        is_const = "const" in param_str
-        if is_const:
-            param_str = param_str.replace("const", "").strip()
+        param_str, const_count = self._remove_const_keywords("", param_str)
+        is_const = const_count > 0
 
         # Check for pointer
         is_pointer = "*" in param_str
         if is_pointer:
-            param_str = param_str.replace("*", "").strip()
-
-        # Split type and name
-        parts = param_str.rsplit(None, 1)
-        if len(parts) == 2:
-            param_type, name = parts
-            return Parameter(
-                name=name,
-                param_type=param_type.strip(),
-                is_pointer=is_pointer,
-                is_const=is_const,
-            )
-        elif len(parts) == 1:
-            # Only type, no name (parameter name omitted)
-            return Parameter(
-                name="",
-                param_type=parts[0].strip(),
-                is_pointer=is_pointer,
-                is_const=is_const,
-            )
-
-        return None
+            param_str = param_str.replace("*", "")
+
+        # Split into words once; the last word is the name, unless the
+        # parameter name is omitted and only the type is left
+        words = param_str.split()
+        if not words:
+            return None
+        name = words.pop() if len(words) > 1 else ""
+
+        return Parameter(
+            name=name,
+            param_type=" ".join(words),
+            is_pointer=is_pointer,
+            is_const=is_const,
+        )
 
     def _split_parameters(self, param_string: str) -> List[str]:
         """Split parameters by comma, respecting nested parentheses."""
+        # Without parentheses every comma separates parameters, so a plain
+        # str.split is enough (a trailing empty piece is not a parameter)
+        if "(" not in param_string and ")" not in param_string:
+            parameters = param_string.split(",")
+            if not parameters[-1]:
+                parameters.pop()
+            return parameters
+
         parameters = []
-        current_param = []
+        param_start = 0
         paren_depth = 0
 
-        for char in param_string:
+        # Jump between delimiters and slice each parameter out of the
+        # string, rather than accumulating it piece by piece
+        for delimiter in self._param_delimiters(param_string):
+            char = delimiter.group()
             if char == "(":
                 paren_depth += 1
-                current_param.append(char)
             elif char == ")":
                 paren_depth -= 1
-                current_param.append(char)
-            elif char == "," and paren_depth == 0:
-                parameters.append("".join(current_param))
-                current_param = []
-            else:
-                current_param.append(char)
+            elif paren_depth == 0:
+                comma_pos = delimiter.start()
+                parameters.append(param_string[param_start:comma_pos])
+                param_start = comma_pos + 1
 
-        if current_param:
-            parameters.append("".join(current_param))
+        if param_start < len(param_string):
+            parameters.append(param_string[param_start:])
 
         return parameters
 
     def is_autosar_function(self, line: str) -> bool:
         """Check if line contains AUTOSAR function declaration."""
-        return bool(
-            self.FUNC_PATTERN.search(line)
-            or self.FUNC_P2VAR_PATTERN.search(line)
-            or self.FUNC_P2CONST_PATTERN.search(line)
-        )
+        # Substring check first: far cheaper than a regex search on the
+        # common non-matching line
+        return "FUNC" in line and bool(self._declaration_search(line))
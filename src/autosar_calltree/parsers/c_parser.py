@@ -10,18 +10,23 @@ Example usage:
 
     parser = CParser(preprocessor_config=PreprocessorConfig())
     functions = parser.parse_file(Path("example.c"))
+    functions = parser.parse_string("void f(void) {}")
+    functions = parser.parse_files([Path("a.c"), Path("b.c")])
 """
 
+import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pycparser import c_parser
 
 from ..config import PreprocessorConfig
 from ..database.models import FunctionCall, FunctionInfo, FunctionType
+from .autosar_parser import AutosarParser
 from .function_visitor import FunctionVisitor
 
 
@@ -65,6 +70,72 @@ class CParser:
     C_KEYWORDS = FunctionVisitor.C_KEYWORDS
     AUTOSAR_MACROS = FunctionVisitor.AUTOSAR_MACROS
     AUTOSAR_TYPES = FunctionVisitor.AUTOSAR_TYPES
+    REJECTED_CALL_NAMES = FunctionVisitor.REJECTED_CALL_NAMES
+
+    # AUTOSAR macro rewrites applied before handing code to pycparser, as one
+    # alternation so the code is scanned once. Each alternative captures the
+    # type in its own group; the replacement for group N is
+    # AUTOSAR_MACRO_REPLACEMENTS[N]. Scanning left to right, P2VAR(...) and
+    # P2CONST(...) are matched as a whole before VAR(...)/CONST(...) can
+    # match their tails.
+    AUTOSAR_MACRO_PATTERN = re.compile(
+        "|".join(
+            (
+                # FUNC_P2VAR/FUNC_P2CONST(return_type, ptr_class, class)
+                r"FUNC_P2\w+\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)\s*",
+                # FUNC(return_type, class)
+                r"FUNC\s*\(\s*([^,]+)\s*,\s*[^)]+\)\s*",
+                # P2VAR(type, ptr_class, class)
+                r"P2VAR\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)",
+                # P2CONST(type, ptr_class, class)
+                r"P2CONST\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)",
+                # CONST(type, class)
+                r"CONST\s*\(\s*([^,]+)\s*,\s*[^)]+\)",
+                # VAR(type, class)
+                r"VAR\s*\(\s*([^,]+)\s*,\s*[^)]+\)",
+            )
+        )
+    )
+    AUTOSAR_MACRO_REPLACEMENTS = (
+        "",
+        "{}* ",  # FUNC_P2VAR/FUNC_P2CONST -> return_type*
+        "{} ",  # FUNC -> return_type
+        "{}*",  # P2VAR -> type*
+        "const {}*",  # P2CONST -> const type*
+        "const {}",  # CONST -> const type
+        "{}",  # VAR -> type
+    )
+    # Directives pycparser cannot handle (#pragma, #line, ...)
+    UNSUPPORTED_DIRECTIVE_PATTERN = re.compile(
+        r"^#\s*(?:pragma|line|error|warning).*$", re.MULTILINE
+    )
+    # Directive removal and macro rewrites as one alternation, so the code
+    # is scanned once. The directive alternative has no groups, so its
+    # lastindex is None and it is replaced by AUTOSAR_MACRO_REPLACEMENTS[0]
+    PYCPARSER_REWRITE_PATTERN = re.compile(
+        f"{UNSUPPORTED_DIRECTIVE_PATTERN.pattern}|{AUTOSAR_MACRO_PATTERN.pattern}",
+        re.MULTILINE,
+    )
+
+    # Start of an AUTOSAR function declaration: FUNC(...) or FUNC_P2VAR(...)
+    AUTOSAR_FUNCTION_START_PATTERN = re.compile(r"^\s*FUNC(_P2\w+)?\s*\(")
+    # Traditional declaration heuristic: return_type func_name(
+    TRADITIONAL_FUNCTION_PATTERN = re.compile(
+        r"^[a-zA-Z_][a-zA-Z0-9_*\s]+\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\("
+    )
+    # Function body: optional whitespace, then the opening brace
+    BODY_START_PATTERN = re.compile(r"\s*\{")
+    BRACE_PATTERN = re.compile(r"[{}]")
+    # Function call: identifier(
+    FUNCTION_CALL_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+
+    # Comment removal in one left-to-right scan: string and char literals
+    # (group 1) are matched as a whole so comment markers inside them are
+    # kept, while block and line comments are dropped
+    COMMENT_PATTERN = re.compile(
+        r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|/\*.*?\*/|//[^\n]*""",
+        re.DOTALL,
+    )
 
     def __init__(self, preprocessor_config: Optional[PreprocessorConfig] = None):
         """
@@ -76,6 +147,8 @@ class CParser:
         """
         self.parser = c_parser.CParser()
         self.preprocessor_config = preprocessor_config
+        # Shared across files so its parameter cache carries over
+        self.autosar_parser = AutosarParser()
 
     def parse_file(self, file_path: Path) -> List[FunctionInfo]:
         """
@@ -91,50 +164,99 @@ class CParser:
             List of FunctionInfo objects
         """
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            content = self._read_source(file_path)
         except Exception:
             return []
 
-        all_functions = []
-        seen_functions = set()  # Track (name, line_number) to avoid duplicates
+        return self.parse_string(content, file_path)
 
-        # First, parse AUTOSAR functions if any
-        if "FUNC(" in content:
-            from .autosar_parser import AutosarParser
+    def parse_files(
+        self, file_paths: Iterable[Path], max_workers: Optional[int] = None
+    ) -> List[FunctionInfo]:
+        """
+        Parse several C source files in parallel worker processes.
 
-            autosar_parser = AutosarParser()
-            lines = content.split("\n")
-            for line_num, line in enumerate(lines, 1):
-                if "FUNC" in line and "(" in line:
-                    autosar_func = autosar_parser.parse_function_declaration(
-                        line, file_path, line_num
-                    )
-                    if autosar_func:
-                        key = (autosar_func.name, autosar_func.line_number)
-                        if key not in seen_functions:
-                            seen_functions.add(key)
-                            # Extract function body and calls
-                            line_start = content.find(line)
-                            if line_start != -1:
-                                body_start = line_start + len(line)
-                                function_body = (
-                                    self._extract_function_body_from_content(
-                                        content, body_start
-                                    )
-                                )
-                                if function_body:
-                                    called_functions = (
-                                        self._extract_function_calls_from_body(
-                                            function_body
-                                        )
-                                    )
-                                    autosar_func.calls = called_functions
-                            all_functions.append(autosar_func)
+        Files are independent, so they are spread over a process pool (each
+        worker builds its own CParser with this parser's preprocessor config)
+        to use all cores instead of one GIL-bound thread.
+
+        Args:
+            file_paths: Paths to the C source files
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            List of FunctionInfo objects, grouped by file in input order
+        """
+        file_paths = list(file_paths)
+        workers = max_workers or os.cpu_count() or 1
+        workers = min(workers, len(file_paths))
+
+        all_functions: List[FunctionInfo] = []
+        # Not worth starting processes for a single worker
+        if workers <= 1:
+            for file_path in file_paths:
+                all_functions.extend(self.parse_file(file_path))
+            return all_functions
+
+        chunksize = max(1, len(file_paths) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_parser,
+            initargs=(self.preprocessor_config,),
+        ) as executor:
+            for functions in executor.map(
+                _parse_file_in_worker, file_paths, chunksize=chunksize
+            ):
+                all_functions.extend(functions)
+
+        return all_functions
+
+    def _read_source(self, file_path: Path) -> str:
+        """
+        Read a source file as text.
+
+        Reads the raw bytes and decodes them in one call, which is cheaper
+        than read_text()'s incremental decoder. Line endings are normalized
+        to '\\n' the same way read_text() does.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            File content with undecodable bytes dropped
+        """
+        content = file_path.read_bytes().decode("utf-8", errors="ignore")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def parse_string(
+        self, content: str, file_path: Path = Path("<string>")
+    ) -> List[FunctionInfo]:
+        """
+        Parse C source code held in memory and extract all function definitions.
+
+        Same as parse_file() but without reading from disk. Note that cpp
+        preprocessing (when enabled) still runs on file_path, so in-memory
+        code falls back to regex preprocessing unless file_path exists.
+
+        Args:
+            content: C source code
+            file_path: Path recorded as the origin of the parsed functions
+
+        Returns:
+            List of FunctionInfo objects
+        """
+        # First, parse AUTOSAR functions (with their calls) and remove their
+        # declarations before preprocessing, so they don't get converted and
+        # parsed as traditional C functions
+        all_functions, content_for_traditional_c = self._split_autosar_functions(
+            content, file_path, extract_calls=True
+        )
+        # Track (name, line_number) to avoid duplicates
+        seen_functions = {(f.name, f.line_number) for f in all_functions}
 
         # Then, parse traditional C functions using pycparser
-        # Remove AUTOSAR function declarations before preprocessing
-        # so they don't get converted and parsed as traditional C functions
-        content_for_traditional_c = self._remove_autosar_functions(content)
 
         # Use cpp preprocessor if config is provided and enabled
         if self.preprocessor_config and self.preprocessor_config.enabled:
@@ -266,60 +388,24 @@ typedef unsigned long ulong;
 """
         preprocessed = autosar_typedefs + preprocessed
 
-        # Replace AUTOSAR function macros with dummy declarations
-        # Pattern: FUNC(return_type, class) func_name(params);
-        # We convert to: return_type func_name(params);
-        preprocessed = re.sub(
-            r"FUNC\s*\(\s*([^,]+)\s*,\s*[^)]+\)\s*",
-            r"\1 ",
-            preprocessed,
-        )
-
-        # Replace FUNC_P2VAR, FUNC_P2CONST, etc.
-        preprocessed = re.sub(
-            r"FUNC_P2\w+\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)\s*",
-            r"\1* ",
-            preprocessed,
-        )
-
-        # Remove AUTOSAR variable macros from parameter lists
-        # VAR(type, class) -> type
-        preprocessed = re.sub(
-            r"VAR\s*\(\s*([^,]+)\s*,\s*[^)]+\)",
-            r"\1",
-            preprocessed,
-        )
-
-        # P2VAR(type, class, ...) -> type*
-        preprocessed = re.sub(
-            r"P2VAR\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)",
-            r"\1*",
-            preprocessed,
-        )
-
-        # P2CONST(type, class, ...) -> const type*
-        preprocessed = re.sub(
-            r"P2CONST\s*\(\s*([^,]+)\s*,\s*[^,]+,\s*[^)]+\)",
-            r"const \1*",
-            preprocessed,
-        )
-
-        # CONST(type, ...) -> const type
-        preprocessed = re.sub(
-            r"CONST\s*\(\s*([^,]+)\s*,\s*[^)]+\)",
-            r"const \1",
-            preprocessed,
-        )
-
-        # Remove other problematic preprocessor directives
-        # (keep includes for now, they'll be handled by cpp if needed)
-        # Remove #pragma, #line, etc.
-        preprocessed = re.sub(
-            r"^#\s*(pragma|line|error|warning).*$", "", preprocessed, flags=re.MULTILINE
+        # Replace AUTOSAR macros and remove problematic preprocessor
+        # directives in a single pass:
+        # FUNC(return_type, class) func_name(params);
+        # becomes: return_type func_name(params);
+        # VAR/P2VAR/P2CONST/CONST parameter macros become plain C types,
+        # and #pragma, #line, etc. are removed (includes are kept, they'll
+        # be handled by cpp if needed)
+        preprocessed = self.PYCPARSER_REWRITE_PATTERN.sub(
+            self._replace_autosar_macro, preprocessed
         )
 
         return preprocessed
 
+    def _replace_autosar_macro(self, match: re.Match) -> str:
+        """Rewrite one match of PYCPARSER_REWRITE_PATTERN."""
+        index = match.lastindex or 0
+        return self.AUTOSAR_MACRO_REPLACEMENTS[index].format(match.group(index))
+
     def _extract_function_body_from_content(
         self, content: str, start_pos: int
     ) -> Optional[str]:
@@ -334,25 +420,21 @@ typedef unsigned long ulong;
             Function body string or None if not found
         """
         # Skip whitespace and look for opening brace
-        remaining = content[start_pos:].lstrip()
-        if not remaining.startswith("{"):
+        body_start = self.BODY_START_PATTERN.match(content, start_pos)
+        if not body_start:
             return None
 
-        # Match balanced braces
+        # Match balanced braces, jumping from brace to brace
+        body_pos = body_start.end() - 1
         brace_count = 0
-        body_chars = []
 
-        for char in remaining:
-            body_chars.append(char)
-            if char == "{":
+        for brace in self.BRACE_PATTERN.finditer(content, body_pos):
+            if brace.group() == "{":
                 brace_count += 1
-            elif char == "}":
+            else:
                 brace_count -= 1
                 if brace_count == 0:
-                    break
-
-        if brace_count == 0:
-            return "".join(body_chars)
+                    return content[body_pos : brace.end()]
 
         return None
 
@@ -371,94 +453,118 @@ typedef unsigned long ulong;
             List of FunctionCall objects
         """
         called_functions: List[FunctionCall] = []
-        seen_names = set()
 
-        # Pattern to match function calls: identifier(
-        call_pattern = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
-
-        for match in call_pattern.finditer(function_body):
-            function_name = match.group(1)
-
-            # Skip C keywords
-            if function_name in self.C_KEYWORDS:
-                continue
-
-            # Skip AUTOSAR types (might be casts)
-            if function_name in self.AUTOSAR_TYPES:
+        # Collect all called names in one scan, then filter each unique
+        # name once instead of every call site
+        for function_name in sorted(
+            set(self.FUNCTION_CALL_PATTERN.findall(function_body))
+        ):
+            # Skip C keywords, AUTOSAR types (might be casts) and AUTOSAR macros
+            if function_name in self.REJECTED_CALL_NAMES:
                 continue
 
-            # Skip AUTOSAR macros
-            if function_name in self.AUTOSAR_MACROS:
-                continue
-
-            # Track unique calls
-            if function_name not in seen_names:
-                seen_names.add(function_name)
-                called_functions.append(
-                    FunctionCall(
-                        name=function_name,
-                        is_conditional=False,  # Simple extraction, no if/else tracking
-                        condition=None,
-                        is_loop=False,  # No loop tracking
-                        loop_condition=None,
-                    )
+            called_functions.append(
+                FunctionCall(
+                    name=function_name,
+                    is_conditional=False,  # Simple extraction, no if/else tracking
+                    condition=None,
+                    is_loop=False,  # No loop tracking
+                    loop_condition=None,
                 )
+            )
 
-        return sorted(called_functions, key=lambda fc: fc.name)
+        return called_functions
 
-    def _remove_autosar_functions(self, content: str) -> str:
+    def _split_autosar_functions(
+        self, content: str, file_path: Path, extract_calls: bool
+    ) -> Tuple[List[FunctionInfo], str]:
         """
-        Remove AUTOSAR function declarations from content.
+        Parse AUTOSAR functions and remove their declarations in one pass.
 
-        This prevents AUTOSAR macros from being converted to traditional C
-        and then parsed as traditional C functions.
+        Only the lines containing "FUNC" are visited. Each is parsed as an
+        AUTOSAR declaration; when it starts one, the declaration (including
+        continuation lines up to the one with ';' or '{') is removed from the
+        content handed to pycparser, keeping the body from '{' on. This
+        prevents AUTOSAR macros from being converted to traditional C and
+        then parsed as traditional C functions.
 
         Args:
             content: Original C source code
+            file_path: Path recorded as the origin of the parsed functions
+            extract_calls: Whether to extract calls from AUTOSAR function bodies
 
         Returns:
-            Content with AUTOSAR function declarations removed
+            Tuple of (AUTOSAR functions, content with AUTOSAR function
+            declarations removed)
         """
-        lines = content.split("\n")
-        filtered_lines = []
-        in_autosar_func = False
+        functions: List[FunctionInfo] = []
 
-        for line in lines:
-            stripped = line.strip()
+        # Plain C files have nothing to parse or remove
+        if "FUNC" not in content:
+            return functions, content
+
+        seen_functions = set()
+        parse_declarations = "FUNC(" in content
+        autosar_parser = self.autosar_parser
+        is_autosar_start = self.AUTOSAR_FUNCTION_START_PATTERN.match
+
+        # Every line of text ends with "\n"; the kept pieces are joined and
+        # the final "\n" dropped again
+        text = content + "\n"
+        kept: List[str] = []
+        # Text before this offset has been copied or removed
+        copied_to = 0
+
+        for line_num, line_start, line in self._lines_containing(text, "FUNC"):
+            if parse_declarations and "(" in line:
+                autosar_func = autosar_parser.parse_function_declaration(
+                    line, file_path, line_num
+                )
+                if autosar_func:
+                    key = (autosar_func.name, autosar_func.line_number)
+                    if key not in seen_functions:
+                        seen_functions.add(key)
+                        if extract_calls:
+                            # Extract function body and calls
+                            function_body = self._extract_function_body_from_content(
+                                content, line_start + len(line)
+                            )
+                            if function_body:
+                                autosar_func.calls = (
+                                    self._extract_function_calls_from_body(
+                                        function_body
+                                    )
+                                )
+                        functions.append(autosar_func)
+
+            # Already removed as part of a multi-line declaration
+            if line_start < copied_to:
+                continue
 
             # Check if this line starts an AUTOSAR function declaration
             # Pattern: FUNC(...) or FUNC_P2VAR(...) etc.
-            if re.match(r"^\s*FUNC(_P2\w+)?\s*\(", stripped):
-                # Check if this is a full declaration (ends with ; or {)
-                # or a multi-line declaration
-                if ";" in stripped or "{" in stripped:
-                    # Single-line declaration - skip it
-                    in_autosar_func = False
-                    # If it ends with {, we need to skip the body too
-                    if "{" in stripped:
-                        # Keep the body (everything after {)
-                        open_brace_pos = stripped.find("{")
-                        if open_brace_pos != -1:
-                            filtered_lines.append(stripped[open_brace_pos:])
-                else:
-                    # Multi-line declaration start
-                    in_autosar_func = True
-            elif in_autosar_func:
-                # We're in a multi-line AUTOSAR declaration
-                if ";" in stripped or "{" in stripped:
-                    # End of declaration
-                    in_autosar_func = False
-                    # If it ends with {, we need to keep the body
-                    if "{" in stripped:
-                        open_brace_pos = stripped.find("{")
-                        if open_brace_pos != -1:
-                            filtered_lines.append(stripped[open_brace_pos:])
-                # Skip the declaration lines
-            else:
-                # Not an AUTOSAR function line
-                filtered_lines.append(line)
+            # Cheap prefix test first; most lines never reach the regex
+            stripped = line.strip()
+            if not (stripped.startswith("FUNC") and is_autosar_start(stripped)):
+                continue
+
+            kept.append(text[copied_to:line_start])
+            # Skip declaration lines until one ends it with ; or {
+            while line_start < len(text):
+                line_end = text.find("\n", line_start)
+                stripped = text[line_start:line_end].strip()
+                line_start = line_end + 1
+                # If it ends with {, keep the body (everything from {)
+                open_brace_pos = stripped.find("{")
+                if open_brace_pos != -1:
+                    kept.append(stripped[open_brace_pos:] + "\n")
+                    break
+                if ";" in stripped:
+                    break
+            copied_to = line_start
 
-        return "\n".join(filtered_lines)
+        kept.append(text[copied_to:])
+        return functions, "".join(kept)[:-1]
 
     def _remove_comments(self, content: str) -> str:
         """
@@ -474,47 +580,13 @@ typedef unsigned long ulong;
         Returns:
             Source with comments removed, string/char literals preserved
         """
-        # Placeholders for protected content
-        string_placeholders: Dict[str, str] = {}
-        char_placeholders: Dict[str, str] = {}
-
-        def replace_string(match: re.Match) -> str:
-            """Replace string literal with placeholder."""
-            key = f"__STR_{len(string_placeholders)}__"
-            string_placeholders[key] = match.group(0)
-            return key
-
-        def replace_char(match: re.Match) -> str:
-            """Replace character literal with placeholder."""
-            key = f"__CHR_{len(char_placeholders)}__"
-            char_placeholders[key] = match.group(0)
-            return key
+        # Every comment starts with "/", so code without one is returned as
+        # is without scanning its literals
+        if "/" not in content:
+            return content
 
-        # Step 1: Protect string literals (handles escaped quotes)
-        # Pattern: " followed by (non-"-or-backslash OR escaped-char)* followed by "
-        content = re.sub(r'"(?:[^"\\]|\\.)*"', replace_string, content)
-
-        # Step 2: Protect character literals (handles escaped chars)
-        # Pattern: ' followed by (non-'-or-backslash OR escaped-char)* followed by '
-        content = re.sub(r"'(?:[^'\\]|\\.)*'", replace_char, content)
-
-        # Step 3: Remove block comments /* ... */
-        # Use DOTALL so . matches newlines (multi-line comments)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-        # Step 4: Remove line comments // ... (to end of line)
-        # MULTILINE makes $ match at end of each line
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-
-        # Step 5: Restore string literals
-        for key, value in string_placeholders.items():
-            content = content.replace(key, value)
-
-        # Step 6: Restore character literals
-        for key, value in char_placeholders.items():
-            content = content.replace(key, value)
-
-        return content
+        # Literals are replaced by themselves, comments by nothing
+        return self.COMMENT_PATTERN.sub(r"\1", content)
 
     def _has_traditional_c_functions(self, content: str) -> bool:
         """
@@ -529,19 +601,47 @@ typedef unsigned long ulong;
         # Quick heuristic: look for function-like patterns
         # that don't start with FUNC (AUTOSAR macros)
 
-        lines = content.split("\n")
-        for line in lines:
+        # The pattern needs a '(', so only lines containing one are checked
+        for _, _, line in self._lines_containing(content, "("):
             line = line.strip()
             # Look for patterns like: "return_type func_name("
             # but not "FUNC(...)"
-            if re.match(
-                r"^[a-zA-Z_][a-zA-Z0-9_*\s]+\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\(", line
-            ):
+            if self.TRADITIONAL_FUNCTION_PATTERN.match(line):
                 if not line.startswith("FUNC"):
                     return True
 
         return False
 
+    def _lines_containing(
+        self, content: str, marker: str
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over the lines of content that contain marker.
+
+        Jumps from one occurrence of marker to the next with str.find, so
+        lines without it are skipped without being split out of content.
+
+        Args:
+            content: Source code
+            marker: Substring the yielded lines must contain
+
+        Yields:
+            Tuples of (1-based line number, line start offset, line text)
+        """
+        line_number = 1
+        line_start = 0
+        marker_pos = content.find(marker)
+        while marker_pos != -1:
+            next_line_start = content.rfind("\n", line_start, marker_pos) + 1
+            if next_line_start:
+                line_number += content.count("\n", line_start, next_line_start)
+                line_start = next_line_start
+            line_end = content.find("\n", marker_pos)
+            if line_end == -1:
+                line_end = len(content)
+            yield line_number, line_start, content[line_start:line_end]
+            marker_pos = content.find(marker, line_end)
+
     def parse_all(
         self,
         source_files: List[Path],
@@ -660,32 +760,16 @@ typedef unsigned long ulong;
             List of FunctionInfo objects
         """
         try:
-            content = preprocessed_file.read_text(encoding="utf-8", errors="ignore")
+            content = self._read_source(preprocessed_file)
         except Exception:
             return []
 
-        all_functions = []
-        seen_functions = set()
-
-        # First, parse AUTOSAR functions if any
-        if "FUNC(" in content:
-            from .autosar_parser import AutosarParser
-
-            autosar_parser = AutosarParser()
-            lines = content.split("\n")
-            for line_num, line in enumerate(lines, 1):
-                if "FUNC" in line and "(" in line:
-                    autosar_func = autosar_parser.parse_function_declaration(
-                        line, source_file, line_num
-                    )
-                    if autosar_func:
-                        key = (autosar_func.name, autosar_func.line_number)
-                        if key not in seen_functions:
-                            seen_functions.add(key)
-                            all_functions.append(autosar_func)
-
-        # Remove AUTOSAR function declarations before traditional parsing
-        content_for_traditional_c = self._remove_autosar_functions(content)
+        # First, parse AUTOSAR functions and remove their declarations
+        # before traditional parsing
+        all_functions, content_for_traditional_c = self._split_autosar_functions(
+            content, source_file, extract_calls=False
+        )
+        seen_functions = {(f.name, f.line_number) for f in all_functions}
 
         # Apply regex preprocessing for any remaining AUTOSAR macros
         preprocessed = self._preprocess_content(content_for_traditional_c)
@@ -743,3 +827,19 @@ typedef unsigned long ulong;
                     )
 
         return "\n".join(lines)
+
+
+# Parser owned by each parse_files() worker process
+_worker_parser: Optional[CParser] = None
+
+
+def _init_worker_parser(preprocessor_config: Optional[PreprocessorConfig]) -> None:
+    """Create the CParser used by the current worker process."""
+    global _worker_parser
+    _worker_parser = CParser(preprocessor_config=preprocessor_config)
+
+
+def _parse_file_in_worker(file_path: Path) -> List[FunctionInfo]:
+    """Parse one file with the current worker process's CParser."""
+    parser = _worker_parser or CParser()
+    return parser.parse_file(file_path)
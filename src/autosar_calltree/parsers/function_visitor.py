@@ -7,7 +7,7 @@ AST nodes to extract function definitions and calls.
 
 import re
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional, Set
 
 from pycparser import c_ast
 
@@ -18,77 +18,90 @@ class FunctionVisitor(c_ast.NodeVisitor):
     """AST visitor to extract function definitions and calls."""
 
     # C keywords to exclude from function call extraction
-    C_KEYWORDS: Set[str] = {
-        "if",
-        "else",
-        "while",
-        "for",
-        "do",
-        "switch",
-        "case",
-        "default",
-        "return",
-        "break",
-        "continue",
-        "goto",
-        "sizeof",
-        "typedef",
-        "struct",
-        "union",
-        "enum",
-        "const",
-        "volatile",
-        "static",
-        "extern",
-        "auto",
-        "register",
-        "inline",
-        "__inline",
-        "__inline__",
-        "restrict",
-        "__restrict",
-        "__restrict__",
-        "_Bool",
-        "_Complex",
-        "_Imaginary",
-    }
+    C_KEYWORDS: FrozenSet[str] = frozenset(
+        {
+            "if",
+            "else",
+            "while",
+            "for",
+            "do",
+            "switch",
+            "case",
+            "default",
+            "return",
+            "break",
+            "continue",
+            "goto",
+            "sizeof",
+            "typedef",
+            "struct",
+            "union",
+            "enum",
+            "const",
+            "volatile",
+            "static",
+            "extern",
+            "auto",
+            "register",
+            "inline",
+            "__inline",
+            "__inline__",
+            "restrict",
+            "__restrict",
+            "__restrict__",
+            "_Bool",
+            "_Complex",
+            "_Imaginary",
+        }
+    )
 
     # AUTOSAR and standard C macros to exclude
-    AUTOSAR_MACROS: Set[str] = {
-        "INT8_C",
-        "INT16_C",
-        "INT32_C",
-        "INT64_C",
-        "UINT8_C",
-        "UINT16_C",
-        "UINT32_C",
-        "UINT64_C",
-        "INTMAX_C",
-        "UINTMAX_C",
-        "TS_MAKEREF2CFG",
-        "TS_MAKENULLREF2CFG",
-        "TS_MAKEREFLIST2CFG",
-        "STD_ON",
-        "STD_OFF",
-    }
+    AUTOSAR_MACROS: FrozenSet[str] = frozenset(
+        {
+            "INT8_C",
+            "INT16_C",
+            "INT32_C",
+            "INT64_C",
+            "UINT8_C",
+            "UINT16_C",
+            "UINT32_C",
+            "UINT64_C",
+            "INTMAX_C",
+            "UINTMAX_C",
+            "TS_MAKEREF2CFG",
+            "TS_MAKENULLREF2CFG",
+            "TS_MAKEREFLIST2CFG",
+            "STD_ON",
+            "STD_OFF",
+        }
+    )
 
     # Common AUTOSAR types
-    AUTOSAR_TYPES: Set[str] = {
-        "uint8",
-        "uint16",
-        "uint32",
-        "uint64",
-        "sint8",
-        "sint16",
-        "sint32",
-        "sint64",
-        "boolean",
-        "Boolean",
-        "float32",
-        "float64",
-        "Std_ReturnType",
-        "StatusType",
-    }
+    AUTOSAR_TYPES: FrozenSet[str] = frozenset(
+        {
+            "uint8",
+            "uint16",
+            "uint32",
+            "uint64",
+            "sint8",
+            "sint16",
+            "sint32",
+            "sint64",
+            "boolean",
+            "Boolean",
+            "float32",
+            "float64",
+            "Std_ReturnType",
+            "StatusType",
+        }
+    )
+
+    # Names that look like calls but are never recorded as callees
+    REJECTED_CALL_NAMES: FrozenSet[str] = C_KEYWORDS | AUTOSAR_MACROS | AUTOSAR_TYPES
+
+    # Return type text recovered from source: identifiers, spaces and '*'
+    RETURN_TYPE_PATTERN = re.compile(r"^[\w\s\*]+$")
+    RETURN_TYPE_CHAR_PATTERN = re.compile(r"[\w\s\*]")
 
     def __init__(
         self,
@@ -238,18 +251,29 @@ class FunctionVisitor(c_ast.NodeVisitor):
         func_name = node.decl.name
 
         # Search for the function declaration in the original content
-        # Pattern: function_name followed by (
-        pattern = rf"([\w\s\*]+)\s+{re.escape(func_name)}\s*\("
-        match = re.search(pattern, self.content)
-
-        if not match:
+        # Pattern: whitespace, function_name followed by (
+        # Only the name is searched for; the return type is found by walking
+        # back over the run of type characters, which keeps the search linear
+        # instead of backtracking through ([\w\s\*]+)\s+ at every offset.
+        content = self.content
+        name_pattern = re.compile(rf"(?<=\s){re.escape(func_name)}\s*\(")
+        is_type_char = self.RETURN_TYPE_CHAR_PATTERN.match
+        for match in name_pattern.finditer(content):
+            name_start = match.start()
+            type_start = name_start
+            while type_start > 0 and is_type_char(content, type_start - 1):
+                type_start -= 1
+            # Need at least one type character plus the separating whitespace
+            if name_start - type_start >= 2:
+                break
+        else:
             return None
 
         # Extract everything before the function name as the return type
-        return_type_candidate = match.group(1).strip()
+        return_type_candidate = content[type_start:name_start].strip()
 
         # Validate that it looks like a type (contains alphanumeric or *)
-        if re.match(r"^[\w\s\*]+$", return_type_candidate):
+        if self.RETURN_TYPE_PATTERN.match(return_type_candidate):
             return return_type_candidate
 
         return None
@@ -415,50 +439,50 @@ class FunctionVisitor(c_ast.NodeVisitor):
         Returns:
             List of FunctionCall objects
         """
-
         # Walk the AST to find all function calls
-        class CallVisitor(c_ast.NodeVisitor):
-            def __init__(self, parent_visitor: "FunctionVisitor"):
-                self.parent = parent_visitor
-                self.calls: List[FunctionCall] = []
-                self.seen: Set[str] = set()
-
-            def visit_FuncCall(self, call_node: c_ast.FuncCall) -> None:
-                """Visit a function call node."""
-                if isinstance(call_node.name, c_ast.IdentifierType):
-                    func_name = call_node.name.names[0]
-                elif isinstance(call_node.name, c_ast.ID):
-                    func_name = call_node.name.name
-                else:
-                    # Handle other cases (e.g., function pointers)
-                    return
-
-                # Skip C keywords
-                if func_name in FunctionVisitor.C_KEYWORDS:
-                    return
-
-                # Skip AUTOSAR types (might be casts)
-                if func_name in FunctionVisitor.AUTOSAR_TYPES:
-                    return
-
-                # Skip AUTOSAR macros
-                if func_name in FunctionVisitor.AUTOSAR_MACROS:
-                    return
-
-                # Track unique calls
-                if func_name not in self.seen:
-                    self.seen.add(func_name)
-                    self.calls.append(
-                        FunctionCall(
-                            name=func_name,
-                            is_conditional=False,  # TODO: Track if/else context
-                            condition=None,
-                            is_loop=False,  # TODO: Track loop context
-                            loop_condition=None,
-                        )
-                    )
-
         call_visitor = CallVisitor(self)
         call_visitor.visit(node)
 
         return call_visitor.calls
+
+
+class CallVisitor(c_ast.NodeVisitor):
+    """AST visitor collecting the unique calls made in a function body."""
+
+    def __init__(self, parent_visitor: FunctionVisitor):
+        """
+        Initialize the visitor.
+
+        Args:
+            parent_visitor: FunctionVisitor the calls are collected for
+        """
+        self.parent = parent_visitor
+        self.calls: List[FunctionCall] = []
+        self.seen: Set[str] = set()
+
+    def visit_FuncCall(self, call_node: c_ast.FuncCall) -> None:
+        """Visit a function call node."""
+        if isinstance(call_node.name, c_ast.IdentifierType):
+            func_name = call_node.name.names[0]
+        elif isinstance(call_node.name, c_ast.ID):
+            func_name = call_node.name.name
+        else:
+            # Handle other cases (e.g., function pointers)
+            return
+
+        # Skip C keywords, AUTOSAR types (might be casts) and AUTOSAR macros
+        if func_name in FunctionVisitor.REJECTED_CALL_NAMES:
+            return
+
+        # Track unique calls
+        if func_name not in self.seen:
+            self.seen.add(func_name)
+            self.calls.append(
+                FunctionCall(
+                    name=func_name,
+                    is_conditional=False,  # TODO: Track if/else context
+                    condition=None,
+                    is_loop=False,  # TODO: Track loop context
+                    loop_condition=None,
+                )
+            )
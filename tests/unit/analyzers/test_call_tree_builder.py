@@ -1,4 +1,4 @@
-"""Tests for analyzers/call_tree_builder.py (SWUT_ANALYZER_00001-00015)"""
+"""Tests for analyzers/call_tree_builder.py (SWUT_ANALYZER_00001-00016)"""
 
 from pathlib import Path
 
@@ -382,3 +382,25 @@ def test_verbose_logging():
     # Verify result is created
     assert result.root_function is not None
     assert result.call_tree is not None
+
+
+# SWUT_ANALYZER_00016: Qualified Name File Stem Cache
+
+
+def test_qualified_name_file_stem_cached():
+    """SWUT_ANALYZER_00016
+
+    Test that the file stem of qualified names is resolved once per file.
+    """
+    db = FunctionDatabase(source_dir=Path("./demo"))
+    db.build_database(use_cache=False, verbose=False)
+
+    builder = CallTreeBuilder(db)
+    result = builder.build_tree("Demo_Init", max_depth=5, verbose=False)
+
+    functions = builder.get_all_functions_in_tree(result.call_tree)
+    for func in functions:
+        qualified_name = builder._get_qualified_name(func)
+        assert qualified_name == f"{Path(func.file_path).stem}::{func.name}"
+
+    assert set(builder._file_stem_cache) == {func.file_path for func in functions}
@@ -3,9 +3,11 @@
 import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from autosar_calltree.config.module_config import ModuleConfig
 from autosar_calltree.database.function_database import (
+    CACHE_VERSION,
     CacheMetadata,
     FunctionDatabase,
     _format_file_size,
@@ -606,6 +608,110 @@ class TestCaching:
 
             assert not db.cache_file.exists()
 
+    def test_cache_invalidated_when_source_changes(self):
+        """SWUT_DB_00013
+
+        Test cache is rejected once a source file has been modified."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = Path(temp_dir) / "src"
+            src_dir.mkdir()
+            source = src_dir / "a.c"
+            source.write_text("void func_a(void) {}\n")
+            cache_dir = Path(temp_dir) / "cache"
+
+            db1 = FunctionDatabase(source_dir=str(src_dir), cache_dir=str(cache_dir))
+            db1.build_database(use_cache=True, verbose=False)
+
+            source.write_text("void func_a(void) {}\nvoid func_b(void) {}\n")
+
+            db2 = FunctionDatabase(source_dir=str(src_dir), cache_dir=str(cache_dir))
+            assert db2._load_from_cache(verbose=False) is False
+
+            db2.build_database(use_cache=True, verbose=False)
+            assert "func_b" in db2.functions
+
+    def test_file_cache_reused_for_unchanged_files(self):
+        """SWUT_DB_00018
+
+        Test unchanged files are loaded from the per-file cache on rebuild."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = Path(temp_dir) / "src"
+            src_dir.mkdir()
+            (src_dir / "a.c").write_text("void func_a(void) {}\n")
+            (src_dir / "b.c").write_text("void func_b(void) {}\n")
+            cache_dir = Path(temp_dir) / "cache"
+
+            db1 = FunctionDatabase(source_dir=str(src_dir), cache_dir=str(cache_dir))
+            db1.build_database(use_cache=True, verbose=False)
+            assert len(list(db1.file_cache_dir.glob("*.pkl"))) == 2
+
+            # Modify one file so the whole-database cache is stale
+            (src_dir / "b.c").write_text("void func_c(void) {}\n")
+
+            db2 = FunctionDatabase(source_dir=str(src_dir), cache_dir=str(cache_dir))
+            parsed = []
+            original_parse = db2._parse_file
+
+            def tracking_parse(file_path):
+                parsed.append(file_path.name)
+                return original_parse(file_path)
+
+            db2._parse_file = tracking_parse
+            db2.build_database(use_cache=True, verbose=False)
+
+            assert parsed == ["b.c"]
+            assert sorted(db2.functions) == ["func_a", "func_c"]
+            # The entry of the old b.c content is pruned
+            assert len(list(db2.file_cache_dir.glob("*.pkl"))) == 2
+
+    def test_cache_invalidated_by_cache_version(self):
+        """SWUT_DB_00018
+
+        Test whole-database and per-file cache entries of another cache version
+        are not reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = Path(temp_dir) / "src"
+            src_dir.mkdir()
+            (src_dir / "a.c").write_text("void func_a(void) {}\n")
+            cache_dir = Path(temp_dir) / "cache"
+
+            db1 = FunctionDatabase(source_dir=str(src_dir), cache_dir=str(cache_dir))
+            db1.build_database(use_cache=True, verbose=False)
+
+            with patch(
+                "autosar_calltree.database.function_database.CACHE_VERSION",
+                CACHE_VERSION + 1,
+            ):
+                db2 = FunctionDatabase(
+                    source_dir=str(src_dir), cache_dir=str(cache_dir)
+                )
+                assert db2._load_from_cache(verbose=False) is False
+
+                with patch.object(
+                    db2, "_parse_file", wraps=db2._parse_file
+                ) as parse_file:
+                    db2.build_database(use_cache=True, verbose=False)
+
+            parse_file.assert_called_once()
+            assert "func_a" in db2.functions
+            # Only the entry of the new cache version is kept
+            assert len(list(db2.file_cache_dir.glob("*.pkl"))) == 1
+
+    def test_clear_cache_removes_file_cache(self):
+        """SWUT_DB_00020
+
+        Test clearing the cache also removes per-file cache entries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache"
+
+            db = FunctionDatabase(source_dir="./demo", cache_dir=str(cache_dir))
+            db.build_database(use_cache=True, verbose=False)
+            assert db.file_cache_dir.exists()
+
+            db.clear_cache()
+
+            assert not db.file_cache_dir.exists()
+
 
 class TestFileSizeFormatting:
     """Test file size formatting in processing messages (SWUT_DB_00025)."""
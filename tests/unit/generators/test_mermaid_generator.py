@@ -5,7 +5,8 @@ Tests the MermaidGenerator class which generates Mermaid sequence diagrams from
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -277,6 +278,118 @@ def test_module_fallback_to_filename() -> None:
     assert len(participants) == 2
 
 
+# SWUT_GEN_00053: Module Fallback Cached Per File
+def test_module_fallback_cached_per_file() -> None:
+    """SWUT_GEN_00053
+
+    Test unmapped functions sharing a file resolve to one cached participant."""
+    root = create_mock_call_tree(
+        [
+            (
+                "Demo_Init",
+                "demo.c",
+                "DemoModule",
+                [
+                    ("Util_A", "src/util.c", None, []),
+                    ("Util_B", "src/util.c", None, []),
+                ],
+            ),
+        ]
+    )
+
+    gen = MermaidGenerator(use_module_names=True)
+    participants = gen._collect_participants(root)
+
+    assert participants == ["DemoModule", "util"]
+    assert gen._file_stem_cache == {Path("src/util.c"): "util"}
+
+
+# SWUT_GEN_00054: Participants Collected During Sequence Generation
+def test_sequence_calls_collect_participants() -> None:
+    """SWUT_GEN_00054
+
+    Test sequence generation records participants in first-seen order."""
+    root = create_mock_call_tree(
+        [
+            (
+                "Demo_Init",
+                "demo.c",
+                "DemoModule",
+                [
+                    ("HW_Init", "hw.c", "HardwareModule", []),
+                    ("Demo_Helper", "demo.c", "DemoModule", []),
+                    ("SW_Init", "sw.c", "SoftwareModule", []),
+                ],
+            ),
+        ]
+    )
+
+    gen = MermaidGenerator(use_module_names=True)
+    lines: List[str] = []
+    participants: Dict[str, None] = {}
+    gen._generate_sequence_calls(root, lines, participants=participants)
+
+    assert list(participants) == gen._collect_participants(root)
+    assert list(participants) == ["DemoModule", "HardwareModule", "SoftwareModule"]
+
+
+# SWUT_GEN_00055: Call Trees Deeper Than the Recursion Limit
+def test_deep_call_tree() -> None:
+    """SWUT_GEN_00055
+
+    Test diagram and function table generation for a very deep call chain."""
+    depth = 2000
+    root = CallTreeNode(
+        function_info=create_mock_function("Func_0", "deep.c"), depth=0
+    )
+    node = root
+    for i in range(1, depth + 1):
+        child = CallTreeNode(
+            function_info=create_mock_function(f"Func_{i}", "deep.c"),
+            depth=i,
+            is_optional=i % 2 == 0,
+        )
+        node.add_child(child)
+        node = child
+
+    gen = MermaidGenerator(include_returns=True)
+    diagram = gen._generate_mermaid_diagram(root)
+    table = gen._generate_function_table(root)
+
+    assert "    Func_0->>Func_1: " in diagram
+    assert "    Func_2000-->>Func_1999: return" in diagram
+    assert diagram.count("    opt ") == depth // 2
+    assert diagram.count("    end") == depth // 2
+    assert "`Func_2000`" in table
+
+
+# SWUT_GEN_00056: Call Labels Formatted Once Per Function
+def test_call_label_formatted_once_per_function() -> None:
+    """SWUT_GEN_00056
+
+    Test a function called from several places is labelled once per walk."""
+    helper = create_mock_function(
+        "Demo_Helper",
+        "demo.c",
+        parameters=[
+            Parameter(name="value", param_type="uint8", is_pointer=False),
+        ],
+    )
+    root = CallTreeNode(
+        function_info=create_mock_function("Demo_Init", "demo.c"), depth=0
+    )
+    for _ in range(3):
+        root.add_child(CallTreeNode(function_info=helper, depth=1))
+
+    gen = MermaidGenerator()
+    lines: List[str] = []
+    with patch.object(gen, "_get_call_label", wraps=gen._get_call_label) as label:
+        gen._generate_sequence_calls(root, lines)
+
+    assert label.call_count == 2
+    assert lines.count("    Demo_Init->>Demo_Helper: call(value)") == 3
+
+
 # SWUT_GEN_00006: RTE Function Abbreviation
 def test_rte_abbreviation() -> None:
     """SWUT_GEN_00006
@@ -7,6 +7,7 @@ UML sequence diagrams from call trees.
 import tempfile
 from pathlib import Path
 from typing import List
+from uuid import UUID
 
 import pytest
 from lxml import etree
@@ -310,6 +311,21 @@ class TestRhapsodyXmiGenerator:
         finally:
             output_path.unlink()
 
+    def test_generated_ids_keep_uuid_layout(self):
+        """Test that counter-based IDs are valid, distinct UUIDs."""
+        generator = RhapsodyXmiGenerator()
+
+        ids = [generator._generate_id() for _ in range(100)]
+
+        assert len(set(ids)) == len(ids)
+        for xmi_id in ids:
+            assert xmi_id.startswith("GUID+")
+            assert str(UUID(xmi_id[len("GUID+"):])) == xmi_id[len("GUID+"):]
+
+        # Separate generators draw separate random prefixes
+        other = RhapsodyXmiGenerator()
+        assert other._generate_id() not in ids
+
     # SWR_RH_00005: Rhapsody-specific Metadata
     def test_rhapsody_metadata(self):
         """Test Rhapsody-specific metadata is included."""
@@ -941,6 +957,51 @@ class TestRhapsodyXmiGenerator:
         finally:
             output_path.unlink()
 
+    def test_deep_call_tree(self):
+        """Test call trees deeper than the Python recursion limit."""
+        depth = 2000
+        tree = CallTreeNode(
+            function_info=create_mock_function("Func_0", "deep.c"),
+            children=[],
+            is_recursive=False,
+            depth=0,
+        )
+        node = tree
+        for i in range(1, depth + 1):
+            child = CallTreeNode(
+                function_info=create_mock_function(f"Func_{i}", "deep.c"),
+                children=[],
+                is_recursive=False,
+                depth=i,
+            )
+            node.children.append(child)
+            node = child
+
+        stats = AnalysisStatistics(
+            total_functions=depth + 1,
+            unique_functions=depth + 1,
+            max_depth_reached=depth,
+            circular_dependencies_found=0,
+        )
+
+        result = AnalysisResult(
+            root_function="Func_0",
+            call_tree=tree,
+            statistics=stats,
+            errors=[],
+            circular_dependencies=[],
+        )
+
+        generator = RhapsodyXmiGenerator()
+        xml_str = generator.generate_to_string(result)
+        root = etree.fromstring(xml_str.encode("utf-8"))
+
+        messages = self._find_elements(root, "message", self.UML_NAMESPACE)
+        assert len(messages) == depth
+        # Messages follow the call order
+        assert messages[0].get("name") == "Func_1"
+        assert messages[-1].get("name") == f"Func_{depth}"
+
     # Test parameter handling in messages
     # SKIP REMOVED: Re-enabled test
     def test_parameter_handling(self):
@@ -1022,6 +1083,50 @@ class TestRhapsodyXmiGenerator:
         finally:
             output_path.unlink()
 
+    def test_message_signature_cached_per_document(self):
+        """Test repeated callees share a signature and the cache is per document."""
+        shared = create_mock_function(
+            "Shared_Func",
+            "shared.c",
+            parameters=[Parameter(name="id", param_type="uint8", is_pointer=False)],
+        )
+        tree = CallTreeNode(
+            function_info=create_mock_function("Root_Func", "root.c"),
+            children=[
+                CallTreeNode(
+                    function_info=shared, children=[], is_recursive=False, depth=1
+                )
+                for _ in range(2)
+            ],
+            is_recursive=False,
+            depth=0,
+        )
+
+        stats = AnalysisStatistics(
+            total_functions=2,
+            unique_functions=2,
+            max_depth_reached=1,
+            circular_dependencies_found=0,
+        )
+
+        result = AnalysisResult(
+            root_function="Root_Func",
+            call_tree=tree,
+            statistics=stats,
+            errors=[],
+            circular_dependencies=[],
+        )
+
+        generator = RhapsodyXmiGenerator()
+        root = etree.fromstring(generator.generate_to_string(result).encode("utf-8"))
+
+        messages = self._find_elements(root, "message", self.UML_NAMESPACE)
+        assert [msg.get("signature") for msg in messages] == ["Shared_Func(id)"] * 2
+
+        # A new document starts with an empty cache
+        generator.generate_to_string(create_mock_analysis_result())
+        assert id(shared) not in generator._signature_cache
+
     # Test file output path creation
     def test_output_directory_creation(self):
         """Test that output directories are created if they don't exist."""
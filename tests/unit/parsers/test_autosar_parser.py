@@ -1,6 +1,7 @@
-"""Tests for parsers/autosar_parser.py (SWUT_PARSER_00001-00010)"""
+"""Tests for parsers/autosar_parser.py (SWUT_PARSER_00001-00010, 00045, 00050-00054)"""
 
 from pathlib import Path
+from unittest.mock import patch
 
 from autosar_calltree.database.models import FunctionType
 from autosar_calltree.parsers.autosar_parser import AutosarParser
@@ -243,6 +244,12 @@ def test_parameter_string_extraction():
     param_string = parser._extract_param_string(line, start)
     assert "(void (*)(int)" in param_string
 
+    # Test parameter list continued on the next line (no closing parenthesis)
+    line = "FUNC(void, RTE_CODE) LongFunc(VAR(uint8, AUTOMATIC) a,"
+    start = line.find("LongFunc")
+    param_string = parser._extract_param_string(line, start)
+    assert param_string == "(VAR(uint8, AUTOMATIC) a,"
+
 
 # SWUT_PARSER_00010: Function Declaration Parsing
 
@@ -302,3 +309,165 @@ def test_return_type_conversion():
     line = "FUNC_P2CONST(ConfigType, AUTOMATIC, APPL_CONST) GetConfig(void)"
     result = parser.parse_function_declaration(line, Path("test.c"), 1)
     assert result.return_type == "const ConfigType*"
+
+
+# SWUT_PARSER_00050: Combined Declaration Pattern
+
+
+def test_combined_declaration_pattern():
+    """SWUT_PARSER_00050
+
+    Test that the combined declaration pattern maps each macro to the groups
+    of its own pattern, and that lines without FUNC are rejected.
+    """
+    patterns = [
+        AutosarParser.FUNC_PATTERN,
+        AutosarParser.FUNC_P2VAR_PATTERN,
+        AutosarParser.FUNC_P2CONST_PATTERN,
+    ]
+    macros = sorted(AutosarParser._DECLARATION_MACROS.items())
+
+    offset = 0
+    for pattern, (lastindex, (group_offset, _, _)) in zip(patterns, macros):
+        assert group_offset == offset
+        offset += pattern.groups
+        assert lastindex == offset
+    assert AutosarParser.FUNCTION_DECLARATION_PATTERN.groups == offset
+
+    parser = AutosarParser()
+    line = "STATIC FUNC(void, RTE_CODE, EXTRA) TestFunc(void)"
+    result = parser.parse_function_declaration(line, Path("test.c"), 1)
+    assert result.is_static is True
+    assert result.memory_class == "RTE_CODE, EXTRA"
+    assert result.function_type == FunctionType.AUTOSAR_FUNC
+
+    line = "uint8 TestFunc(VAR(uint8, AUTOMATIC) value)"
+    assert parser.parse_function_declaration(line, Path("test.c"), 1) is None
+
+
+# SWUT_PARSER_00051: AUTOSAR Function Line Detection
+
+
+def test_is_autosar_function():
+    """SWUT_PARSER_00051
+
+    Test that lines are classified as AUTOSAR function declarations or not.
+    """
+    parser = AutosarParser()
+
+    assert parser.is_autosar_function("FUNC(void, RTE_CODE) Demo_Init(void)")
+    assert parser.is_autosar_function(
+        "STATIC FUNC_P2VAR(uint8, AUTOMATIC, APPL_VAR) GetBuffer(void)"
+    )
+    assert parser.is_autosar_function(
+        "FUNC_P2CONST(ConfigType, AUTOMATIC, APPL_CONST) GetConfig(void)"
+    )
+    assert not parser.is_autosar_function("void Demo_Init(void)")
+    assert not parser.is_autosar_function("    FUNCTION_CALL(a, b);")
+
+
+# SWUT_PARSER_00052: Parameter Splitting
+
+
+def test_split_parameters():
+    """SWUT_PARSER_00052
+
+    Test that parameters are split on top-level commas only.
+    """
+    parser = AutosarParser()
+
+    params = parser._split_parameters(
+        "P2VAR(uint8, AUTOMATIC, APPL_VAR) data, void (*cb)(uint8 a, uint8 b), int n"
+    )
+    assert params == [
+        "P2VAR(uint8, AUTOMATIC, APPL_VAR) data",
+        " void (*cb)(uint8 a, uint8 b)",
+        " int n",
+    ]
+    assert parser._split_parameters("") == []
+    assert parser._split_parameters("uint8 a,") == ["uint8 a"]
+    assert parser._split_parameters("uint8 a,, uint16 b") == ["uint8 a", "", " uint16 b"]
+    assert parser._split_parameters("(uint8 a, uint16 b") == ["(uint8 a, uint16 b"]
+
+
+# SWUT_PARSER_00053: Traditional Parameter const Qualifier
+
+
+def test_traditional_parameter_const_qualifier():
+    """SWUT_PARSER_00053
+
+    Test that only the const keyword marks a traditional parameter as const,
+    leaving type names that merely contain "const" intact.
+    """
+    parser = AutosarParser()
+
+    param = parser._parse_traditional_parameter("const uint8* const data")
+    assert param.param_type == "uint8"
+    assert param.name == "data"
+    assert param.is_const is True
+    assert param.is_pointer is True
+
+    param = parser._parse_traditional_parameter("constant_t value")
+    assert param.param_type == "constant_t"
+    assert param.is_const is False
+
+    param = parser._parse_traditional_parameter("reconstruct_t* state")
+    assert param.param_type == "reconstruct_t"
+    assert param.is_const is False
+    assert param.is_pointer is True
+
+
+# SWUT_PARSER_00054: Traditional Parameter Type and Name Split
+
+
+def test_traditional_parameter_split():
+    """SWUT_PARSER_00054
+
+    Test that traditional parameters split into type and name, with omitted
+    names and qualifier-only parameters handled.
+    """
+    parser = AutosarParser()
+
+    param = parser._parse_traditional_parameter("  volatile const uint8 *  buffer ")
+    assert param.param_type == "volatile uint8"
+    assert param.name == "buffer"
+    assert param.is_const is True
+    assert param.is_pointer is True
+
+    param = parser._parse_traditional_parameter("uint16")
+    assert param.param_type == "uint16"
+    assert param.name == ""
+
+    assert parser._parse_traditional_parameter("const") is None
+
+
+# SWUT_PARSER_00045: Parameter Parsing Cache
+
+
+def test_parse_parameters_cached():
+    """SWUT_PARSER_00045
+
+    Test that repeated parameter strings are parsed once, that each call still
+    gets its own list of Parameter objects, and that the cache is bounded.
+    """
+    parser = AutosarParser()
+    param_string = "P2VAR(uint8, AUTOMATIC, APPL_VAR) data, uint16 length"
+
+    first = parser.parse_parameters(param_string)
+    with patch.object(
+        AutosarParser, "_parse_single_parameter", side_effect=AssertionError
+    ):
+        second = parser.parse_parameters(param_string)
+
+    assert second == first
+    assert second is not first
+    assert [p.name for p in second] == ["data", "length"]
+
+    # Changing one function's parameters must not leak into another's
+    second[0].name = "renamed"
+    third = parser.parse_parameters(param_string)
+    assert [p.name for p in first] == ["data", "length"]
+    assert [p.name for p in third] == ["data", "length"]
+
+    cache_info = parser._cached_parameter_fields.cache_info()
+    assert cache_info.maxsize == AutosarParser.PARAMETER_CACHE_SIZE
@@ -1,4 +1,4 @@
-"""Tests for parsers/c_parser.py (SWUT_PARSER_00026-00035)"""
+"""Tests for parsers/c_parser.py (SWUT_PARSER_00026-00035, 00041-00044, 00046-00049)"""
 
 from pathlib import Path
 
@@ -163,7 +163,7 @@ def test_ast_visitor_pattern():
 # SWUT_PARSER_00030: Return Type Extraction from AST
 
 
-def test_ast_return_type_extraction():
+def test_ast_return_type_extraction(tmp_path):
     """SWUT_PARSER_00030
 
     Test that return types are correctly extracted from AST nodes, handling
@@ -172,8 +172,6 @@ def test_ast_return_type_extraction():
     parser = CParser()
 
     # Test various return types
-    import tempfile
-
     test_cases = [
         ("void func(void) {}", "void"),
         ("int func(int x) {}", "int"),
@@ -185,10 +183,9 @@ def test_ast_return_type_extraction():
     ]
 
     for i, (code, expected_return) in enumerate(test_cases):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".c", delete=False) as f:
-            f.write(code + "\n")
+        fixture_path = tmp_path / f"return_type_{i}.c"
+        fixture_path.write_text(code + "\n")
 
-        fixture_path = Path(f.name)
         functions = parser.parse_file(fixture_path)
 
         assert len(functions) == 1
@@ -411,6 +408,204 @@ def test_parse_error_graceful_handling():
     assert functions is not None
 
 
+# SWUT_PARSER_00049: In-Memory Parsing
+
+
+def test_parse_string_matches_parse_file():
+    """SWUT_PARSER_00049
+
+    Test that in-memory parsing yields the same functions as parsing a file.
+    """
+    parser = CParser()
+    fixture_path = (
+        Path(__file__).parent.parent.parent
+        / "fixtures"
+        / "traditional_c"
+        / "with_function_calls.c"
+    )
+
+    from_file = parser.parse_file(fixture_path)
+    from_string = parser.parse_string(fixture_path.read_text(), fixture_path)
+
+    assert [f.name for f in from_string] == [f.name for f in from_file]
+    assert [f.line_number for f in from_string] == [f.line_number for f in from_file]
+    assert all(f.file_path == fixture_path for f in from_string)
+
+
+# SWUT_PARSER_00041: AUTOSAR Body Located by Line Offset
+def test_autosar_body_uses_own_line_offset():
+    """SWUT_PARSER_00041
+
+    Test that each AUTOSAR function body is taken from after its own
+    declaration line, even when an identical line appears earlier.
+    """
+    parser = CParser()
+    content = (
+        "#ifdef VARIANT_A\n"
+        "FUNC(void, RTE_CODE) Demo_Init(void)\n"
+        "{\n"
+        "    Variant_A_Init();\n"
+        "}\n"
+        "#else\n"
+        "FUNC(void, RTE_CODE) Demo_Init(void)\n"
+        "{\n"
+        "    Variant_B_Init();\n"
+        "}\n"
+        "#endif\n"
+    )
+
+    functions = parser.parse_string(content)
+
+    assert [f.line_number for f in functions] == [2, 7]
+    assert [c.name for c in functions[0].calls] == ["Variant_A_Init"]
+    assert [c.name for c in functions[1].calls] == ["Variant_B_Init"]
+
+
+# SWUT_PARSER_00042: Return Type Source Lookup Without Backtracking
+def test_return_type_source_lookup_long_whitespace_run():
+    """SWUT_PARSER_00042
+
+    Test that the source fallback for return types stays linear on long
+    runs of type characters and picks the declaration's own return type.
+    """
+    parser = CParser()
+    content = (
+        "static int counter" + " " * 5000 + "= 0;\n"
+        "const int* get_counter(void)\n"
+        "{\n"
+        "    return &counter;\n"
+        "}\n"
+    )
+
+    functions = parser.parse_string(content)
+
+    assert [f.name for f in functions] == ["get_counter"]
+    assert functions[0].return_type == "const int*"
+
+
+# SWUT_PARSER_00043: Source Files Read With Normalized Line Endings
+def test_parse_file_normalizes_line_endings(tmp_path):
+    """SWUT_PARSER_00043
+
+    Test that CRLF and CR line endings parse the same as LF line endings.
+    """
+    parser = CParser()
+    source = (
+        "/* Demo */\n"
+        "int twice(int value)\n"
+        "{\n"
+        "    return value * 2;\n"
+        "}\n"
+        "static int helper(int value)\n"
+        "{\n"
+        "    return twice(value);\n"
+        "}\n"
+    )
+    results = []
+    for name, newline in (("lf.c", "\n"), ("crlf.c", "\r\n"), ("cr.c", "\r")):
+        path = tmp_path / name
+        path.write_bytes(source.replace("\n", newline).encode("utf-8"))
+        functions = parser.parse_file(path)
+        results.append(
+            [(f.name, f.line_number, [c.name for c in f.calls]) for f in functions]
+        )
+
+    assert [(name, calls) for name, _, calls in results[0]] == [
+        ("twice", []),
+        ("helper", ["twice"]),
+    ]
+    assert results[1] == results[0]
+    assert results[2] == results[0]
+
+
+# SWUT_PARSER_00044: Parallel Parsing of Multiple Files
+def test_parse_files_matches_parse_file():
+    """SWUT_PARSER_00044
+
+    Test that parsing several files in worker processes yields the same
+    functions, in the same order, as parsing them one by one.
+    """
+    parser = CParser()
+    fixtures_dir = Path(__file__).parent.parent.parent / "fixtures"
+    file_paths = sorted((fixtures_dir / "traditional_c").glob("*.c"))
+    file_paths += sorted((fixtures_dir / "autosar_code").glob("*.c"))
+
+    expected = [f for path in file_paths for f in parser.parse_file(path)]
+
+    for max_workers in (1, 2):
+        functions = parser.parse_files(file_paths, max_workers=max_workers)
+        assert [(f.name, f.file_path, f.line_number) for f in functions] == [
+            (f.name, f.file_path, f.line_number) for f in expected
+        ]
+        assert [f.calls for f in functions] == [f.calls for f in expected]
+
+
+# SWUT_PARSER_00046: AUTOSAR Pointer Macros in Traditional Functions
+def test_p2var_macro_in_traditional_function():
+    """SWUT_PARSER_00046
+
+    Test that P2VAR parameters of traditional C functions are rewritten as a
+    whole rather than through the VAR macro they end with.
+    """
+    parser = CParser()
+    content = (
+        "static void helper(P2VAR(uint8, AUTOMATIC, APPL_VAR) data)\n"
+        "{\n"
+        "    use(data);\n"
+        "}\n"
+    )
+
+    functions = parser.parse_string(content)
+
+    assert [f.name for f in functions] == ["helper"]
+    assert functions[0].parameters[0].param_type == "uint8"
+    assert functions[0].parameters[0].is_pointer is True
+    assert [c.name for c in functions[0].calls] == ["use"]
+
+
+# SWUT_PARSER_00047: Marker Line Iteration
+def test_lines_containing_marker():
+    """SWUT_PARSER_00047
+
+    Test that only lines containing the marker are yielded, with their line
+    numbers and start offsets.
+    """
+    parser = CParser()
+    content = "int a;\nFUNC(void, X) f(void)\n\nx = FUNC; y = FUNC;\nFUNC"
+
+    lines = list(parser._lines_containing(content, "FUNC"))
+
+    assert lines == [
+        (2, 7, "FUNC(void, X) f(void)"),
+        (4, 30, "x = FUNC; y = FUNC;"),
+        (5, 50, "FUNC"),
+    ]
+    assert list(parser._lines_containing(content, "missing")) == []
+
+
+# SWUT_PARSER_00048: Directives and Macros Rewritten in One Pass
+def test_directives_and_macros_rewritten_together():
+    """SWUT_PARSER_00048
+
+    Test that unsupported directives are removed and AUTOSAR macros are
+    rewritten by the same preprocessing pass, leaving includes untouched.
+    """
+    parser = CParser()
+    content = (
+        "#include <Std_Types.h>\n"
+        "#pragma section code\n"
+        "FUNC(void, RTE_CODE) f(P2VAR(uint8, AUTOMATIC, RTE_APPL_DATA) p)\n"
+        '#line 10 "f.c"\n'
+        "VAR(uint8, AUTOMATIC) x;\n"
+    )
+
+    preprocessed = parser._preprocess_content(content)
+
+    assert preprocessed.endswith(
+        "#include <Std_Types.h>\n\nvoid f(uint8* p)\n\nuint8 x;\n"
+    )
+
+
 # Tests for comment removal functionality
 
 
@@ -570,3 +765,24 @@ int y;"""
         assert "int x = 10;" in result
         assert 'char* msg = "/* not a comment */"' in result
         assert 'char* url = "http://example.com"' in result
+
+    def test_apostrophe_in_comment(self):
+        """Apostrophes inside comments do not start a char literal."""
+        code = """/* it's a header */
+int x;
+// doesn't match
+int y = 'a';"""
+        result = self.parser._remove_comments(code)
+        assert result == "\nint x;\n\nint y = 'a';"
+
+    def test_quote_char_literal(self):
+        """A double quote char literal does not start a string literal."""
+        code = "char q = '\"'; /* quote */ char* s = \"// kept\";"
+        result = self.parser._remove_comments(code)
+        assert result == "char q = '\"';  char* s = \"// kept\";"
+
+    def test_code_without_comments(self):
+        """Code without any slash is returned unchanged."""
+        code = "char* s = \"text\";\nchar c = '*';\nint x = a * b;"
+        result = self.parser._remove_comments(code)
+        assert result == code